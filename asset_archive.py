@@ -0,0 +1,164 @@
+"""Archivo empaquetado de assets (assets.pak) con lectura por mmap.
+
+El paso de build junta todos los ficheros de assets/ en un unico archivo:
+una cabecera fija, los datos de cada fichero uno detras de otro y al final
+un indice JSON {ruta relativa: {offset, length, mtime_ns, type, sha1}}. En
+ejecucion Assets abre el archivo con mmap y entrega vistas (memoryview)
+sobre el mapeo sin copiar nada; el sistema operativo solo pagina lo que se
+lee. Si no existe assets.pak se siguen usando los ficheros sueltos, y si
+un fichero suelto tiene otro tamano o es mas nuevo que el empaquetado
+(asset editado sin regenerar el archivo) gana el suelto; eso se comprueba
+una sola vez, al abrir el archivo.
+
+Hay que volver a generarlo despues de cambiar cualquier asset.
+
+Uso:
+    python asset_archive.py                # genera assets.pak
+    python asset_archive.py --verify       # comprueba los hashes del indice
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+
+ARCHIVE_MAGIC = b"RCKTPAK2"
+ARCHIVE_HEADER = struct.Struct("<8sQQ")   # magic, offset del indice, longitud
+ARCHIVE_ALIGN = 16
+ARCHIVE_EXCLUDE_DIRS = {"cache"}           # PCM de streams: se regenera en local
+ARCHIVE_EXCLUDE_EXT = {".xcf", ".pngbak"}  # ficheros de trabajo de los artistas
+
+_TYPES = {
+    ".png": "image", ".jpg": "image", ".jpeg": "image", ".svg": "image",
+    ".ogg": "sound", ".wav": "sound", ".mp3": "sound",
+    ".json": "data",
+}
+
+
+class AssetArchive:
+    """Lectura de un assets.pak mapeado en memoria. Las vistas que devuelve
+    view() son de solo lectura y seguras desde varios hilos a la vez."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_offset, index_length = ARCHIVE_HEADER.unpack_from(self._map, 0)
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError(f"{path} no es un archivo de assets")
+            self.index = json.loads(self._map[index_offset:index_offset + index_length])
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._map)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self, prefix=""):
+        return sorted(n for n in self.index if n.startswith(prefix))
+
+    def view(self, name):
+        """memoryview de los bytes de name sin copiarlos, o None."""
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        return self._view[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def verify(self):
+        """Nombres cuyo contenido no coincide con el hash del indice."""
+        return [name for name in self.names()
+                if hashlib.sha1(self.view(name)).hexdigest() != self.index[name]["sha1"]]
+
+    def stale(self, assets_dir):
+        """Nombres cuyo fichero suelto en assets_dir tiene otro tamano o es
+        mas nuevo que la copia empaquetada (asset editado sin regenerar)."""
+        names = []
+        for name, entry in self.index.items():
+            try:
+                st = os.stat(os.path.join(assets_dir, name))
+            except OSError:
+                continue   # build sin ficheros sueltos
+            if st.st_size != entry["length"] or st.st_mtime_ns > entry["mtime_ns"]:
+                names.append(name)
+        return sorted(names)
+
+    def close(self):
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+# ─── BUILD ───────────────────────────────────────────────────
+
+def _collect(assets_dir):
+    """Rutas relativas (con '/') de los ficheros a empaquetar, ordenadas."""
+    names = []
+    for root, dirs, files in os.walk(assets_dir):
+        dirs[:] = sorted(d for d in dirs if d not in ARCHIVE_EXCLUDE_DIRS)
+        for filename in files:
+            if os.path.splitext(filename)[1].lower() in ARCHIVE_EXCLUDE_EXT:
+                continue
+            rel = os.path.relpath(os.path.join(root, filename), assets_dir)
+            names.append(rel.replace(os.sep, "/"))
+    return sorted(names)
+
+
+def build_archive(assets_dir, out_path):
+    """Escribe out_path con todos los assets de assets_dir. Devuelve el
+    indice generado."""
+    index = {}
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(b"\0" * ARCHIVE_HEADER.size)
+        for name in _collect(assets_dir):
+            with open(os.path.join(assets_dir, name), "rb") as f:
+                data = f.read()
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            out.write(b"\0" * (-out.tell() % ARCHIVE_ALIGN))
+            index[name] = {
+                "offset": out.tell(),
+                "length": len(data),
+                "mtime_ns": mtime_ns,
+                "type": _TYPES.get(os.path.splitext(name)[1].lower(), "other"),
+                "sha1": hashlib.sha1(data).hexdigest(),
+            }
+            out.write(data)
+
+        index_data = json.dumps(index, indent=1, sort_keys=True).encode("utf-8")
+        index_offset = out.tell()
+        out.write(index_data)
+        out.seek(0)
+        out.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, index_offset, len(index_data)))
+    os.replace(tmp_path, out_path)
+    return index
+
+
+def main(argv=None):
+    from assets_manager import ASSETS_PATH, ARCHIVE_PATH
+
+    parser = argparse.ArgumentParser(description="Empaqueta assets/ en un unico archivo")
+    parser.add_argument("--out", default=ARCHIVE_PATH)
+    parser.add_argument("--verify", action="store_true",
+                        help="comprueba un archivo existente en vez de generarlo")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        archive = AssetArchive(args.out)
+        bad = archive.verify()
+        print(f"{len(archive.index)} ficheros, {len(bad)} corruptos")
+        for name in bad:
+            print(f"  {name}")
+        archive.close()
+        return 1 if bad else 0
+
+    index = build_archive(ASSETS_PATH, args.out)
+    total = sum(e["length"] for e in index.values())
+    print(f"Archivo generado: {args.out} ({len(index)} ficheros, {total / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+
+
+class BudgetedLRUCache:
+    """Cache LRU con presupuesto de memoria en bytes.
+
+    Cada entrada guarda su tamano (calculado con sizeof(valor)); al superar
+    el presupuesto se expulsan las entradas menos usadas que no esten
+    fijadas con pin(). Una entrada mas grande que todo el presupuesto se
+    conserva igualmente hasta que llegue otra. Se usa como un dict
+    (in, [], []=) y lleva estadisticas de aciertos, fallos y expulsiones.
+    """
+
+    def __init__(self, budget_bytes, sizeof):
+        self.budget_bytes = budget_bytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()  # clave -> (valor, bytes)
+        self._pins = {}                # clave -> contador de pins
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        size = self._sizeof(value)
+        self._entries[key] = (value, size)
+        self.bytes += size
+        self._evict(keep=key)
+
+    def _evict(self, keep=None):
+        if self.bytes <= self.budget_bytes:
+            return
+        for key in list(self._entries):
+            if self.bytes <= self.budget_bytes:
+                break
+            if key == keep or key in self._pins:
+                continue
+            self.bytes -= self._entries.pop(key)[1]
+            self.evictions += 1
+
+    # ─── PINS ─────────────────────────────────────────────────
+
+    def pin(self, key):
+        """Impide expulsar la clave (aunque todavia no este cargada)."""
+        self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key):
+        count = self._pins.get(key, 0) - 1
+        if count > 0:
+            self._pins[key] = count
+        else:
+            self._pins.pop(key, None)
+            self._evict()
+
+    def is_pinned(self, key):
+        return key in self._pins
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'budget_bytes': self.budget_bytes,
+            'pinned': len(self._pins),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -1,9 +1,18 @@
 import pygame
-from settings import ScreenSettings
+from settings import ScreenSettings, GUISettings, AssetSettings
+import io
 import os
+import mmap
+import struct
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_futures
+from sound_stream import SoundStream
+from asset_cache import BudgetedLRUCache
+from asset_archive import AssetArchive
 
 # --- RUTAS DE DIRECTORIOS ---
 BASE_PATH = os.path.dirname(__file__)
+ASSETS_PATH = os.path.join(BASE_PATH, "assets")
 BALLS_PATH = os.path.join(BASE_PATH, "assets", "balls")
 CARS_PATH = os.path.join(BASE_PATH, "assets", "cars")
 GUI_PATH = os.path.join(BASE_PATH, "assets", "gui")
@@ -11,14 +20,129 @@ SFX_PATH = os.path.join(BASE_PATH, "assets", "sfx")
 BACKGROUNDS_PATH = os.path.join(BASE_PATH, "assets", "backgrounds")
 PORTRAITS_PATH = os.path.join(BASE_PATH, "assets", "portraits")
 STADIUMS_PATH = os.path.join(BASE_PATH, "assets", "stadiums")
+STREAM_CACHE_PATH = os.path.join(ASSETS_PATH, "cache", "streams")  # PCM decodificado
+ARCHIVE_PATH = os.path.join(BASE_PATH, "assets.pak")  # generado por asset_archive.py
+RAW_CACHE_PATH = os.path.join(ASSETS_PATH, "cache", "surfaces")  # pixeles en formato de pantalla
+
+RAW_HEADER = struct.Struct("<4sII")  # magic, ancho, alto
+RAW_MAGIC = b"RSF1"
+# mascaras (R, G, B, A) de convert_alpha -> formato de pygame.image.tobytes/frombuffer
+_RAW_FORMATS = {
+    (0xff0000, 0xff00, 0xff, 0xff000000): "BGRA",
+    (0xff, 0xff00, 0xff0000, 0xff000000): "RGBA",
+}
+
+class PreloadJob:
+    """Precarga en curso lanzada por Assets.preload().
+
+    Los hilos del pool solo decodifican (pygame.image.load y mixer.Sound
+    sueltan el GIL mientras leen y descomprimen); convert_alpha, el escalado
+    y la insercion en las caches se hacen en el hilo principal desde poll().
+    Para los streams el pool vuelca el PCM a disco y poll() crea el
+    SoundStream, asi get_stream no decodifica nada en el hilo del juego.
+    """
+
+    def __init__(self, keys, workers=None):
+        self.keys = list(dict.fromkeys(keys))
+        self.total = len(self.keys)
+        self.done = 0
+        self.failed = []
+        self._futures = {}      # future -> (tipo, clave)
+        self._executor = None
+
+        sounds_ok = Assets._init_mixer()
+        Assets._get_archive()  # se abren aqui y no a la vez desde varios hilos
+        Assets._get_raw_format()
+        for key in self.keys:
+            if key in Assets._images_cache or key in Assets._sounds_cache or key in Assets._streams_cache:
+                self.done += 1
+            elif key in Assets._IMAGE_DATA:
+                self._submit('image', key, workers)
+            elif key in Assets._SOUND_DATA and sounds_ok:
+                self._submit('sound', key, workers)
+            elif key in Assets._STREAM_DATA and sounds_ok:
+                self._submit('stream', key, workers)
+            else:
+                self.failed.append(key)
+                self.done += 1
+
+    def _submit(self, kind, key, workers):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers or min(8, os.cpu_count() or 1),
+                thread_name_prefix="assets",
+            )
+        decode = {'image': Assets._load_image_data,
+                  'sound': Assets._decode_sound,
+                  'stream': Assets._stream_pcm_path}[kind]
+        self._futures[self._executor.submit(decode, key)] = (kind, key)
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        return self.done >= self.total
+
+    def poll(self):
+        """Finaliza en el hilo principal lo que ya este decodificado.
+        Devuelve True cuando la precarga ha terminado."""
+        for future in [f for f in self._futures if f.done()]:
+            kind, key = self._futures.pop(future)
+            try:
+                data = future.result()
+                if kind == 'image':
+                    img, from_raw = data
+                    if from_raw:
+                        Assets._images_cache[key] = img
+                    else:
+                        Assets._finalize_image(key, img)
+                elif kind == 'stream':
+                    Assets._streams_cache[key] = SoundStream(data)
+                else:
+                    Assets._sounds_cache[key] = data
+            except Exception as e:
+                print(f"Error precargando {key}: {e}")
+                self.failed.append(key)
+            self.done += 1
+
+        if self.finished and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return self.finished
+
+    def wait(self):
+        """Bloquea hasta terminar la precarga."""
+        while not self.poll():
+            if self._futures:
+                wait_futures(list(self._futures), return_when=FIRST_COMPLETED)
+        return self
+
+
+def _surface_bytes(surf):
+    return surf.get_bytesize() * surf.get_width() * surf.get_height()
+
+
+def _sound_bytes(sound):
+    freq, size, channels = pygame.mixer.get_init() or (44100, -16, 2)
+    return int(sound.get_length() * freq) * (abs(size) // 8) * channels
+
 
 class Assets:
     """
     Gestor centralizado. Carga assets solo cuando se piden (Lazy Loading).
     Permite importar escenas antes de inicializar Pygame.
     """
-    _images_cache = {}
-    _sounds_cache = {}
+    _images_cache = BudgetedLRUCache(AssetSettings.IMAGE_CACHE_BUDGET_MB * 1024 * 1024, _surface_bytes)
+    _sounds_cache = BudgetedLRUCache(AssetSettings.SOUND_CACHE_BUDGET_MB * 1024 * 1024, _sound_bytes)
+    _scene_pins = set()
+    _streams_cache = {}
+    _fonts_cache = {}
+    _archive = None       # AssetArchive abierto, False si no hay assets.pak
+    _archive_stale = frozenset()  # rutas del archivo tapadas por un fichero suelto mas nuevo
+    _raw_format = None    # formato de convert_alpha, False si no se puede cachear
+    _source_hashes = {}   # clave -> sha1 del fichero original
 
     # --- DICCIONARIO DE IMÁGENES  ---
     _IMAGE_DATA = {
@@ -29,6 +153,16 @@ class Assets:
         "stadium1_bg": ("stadium1_bg.png", STADIUMS_PATH, (ScreenSettings.SCREEN_WIDTH, ScreenSettings.SCREEN_HEIGHT)),
         "stadium2_bg": ("stadium2_bg.png", STADIUMS_PATH, (ScreenSettings.SCREEN_WIDTH, ScreenSettings.SCREEN_HEIGHT)),
         "stadium3_bg": ("stadium3_bg.png", STADIUMS_PATH, (ScreenSettings.SCREEN_WIDTH, ScreenSettings.SCREEN_HEIGHT)),
+
+        # Porterias (cada escenario las escala con get_image_variant)
+        "excavator_goalpost_bg": ("excavator_shovel_goalpost_bg.png", STADIUMS_PATH, None),
+        "excavator_goalpost_fg": ("excavator_shovel_goalpost_fg.png", STADIUMS_PATH, None),
+        "container_left_yellow_bg": ("contenedor_left_yellow_bg.png", STADIUMS_PATH, None),
+        "container_left_yellow_fg": ("contenedor_left_yellow_fg.png", STADIUMS_PATH, None),
+        "container_right_green_bg": ("contenedor_right_green_bg.png", STADIUMS_PATH, None),
+        "container_right_green_fg": ("contenedor_right_green_fg.png", STADIUMS_PATH, None),
+        "stadium3_goalpost_bg": ("stadium-3-goalpost-bg.png", STADIUMS_PATH, None),
+        "stadium3_goalpost_fg": ("stadium-3-goalpost-fg.png", STADIUMS_PATH, None),
         
         # Portraits
         "Bulldozer": ("Bulldozer.png", PORTRAITS_PATH, None),
@@ -83,10 +217,8 @@ class Assets:
         "explosion4": "explosion4.ogg",
         "explosion5": "explosion5.ogg",
 
-        # Crowd & Ambience
+        # Crowd
         "crowd_hits_besta": "crowd_hits_besta.ogg",
-        "publico1": "publico1.ogg",
-        "publico_estadio_cantando": "publico_estadio cantando.ogg",
 
         # Goals & Whistles
         "goal1": "goal1.ogg",
@@ -110,6 +242,20 @@ class Assets:
         "dialog_text_4": "dialog_text_4.ogg"
     }
     
+    # --- SONIDOS LARGOS QUE SE REPRODUCEN EN STREAMING (ver get_stream) ---
+    _STREAM_DATA = {
+        # Ambiente de publico
+        "publico1": "publico1.ogg",
+        "publico_estadio_cantando": "publico_estadio cantando.ogg",
+    }
+
+    # Efectos que usa el juego (el resto de _SOUND_DATA se carga bajo demanda)
+    _STARTUP_SOUNDS = [
+        "silbato_corto",
+        "dialog_1", "dialog_2",
+        "dialog_text_1", "dialog_text_2", "dialog_text_3", "dialog_text_4",
+    ]
+
     _MUSIC_DATA = {
         "musica2": "musica2.ogg",
         "musica4": "musica4.ogg",
@@ -126,21 +272,205 @@ class Assets:
         
     }
 
+    # --- FUENTES QUE SE PRECARGAN AL ARRANCAR: (nombre, tamano, bold, italic) ---
+    _FONT_WARMUP = [
+        (GUISettings.FONT_TEXT, GUISettings.FONT_SIZE, False, False),
+        (GUISettings.FONT_TEXT, 48, True, False),
+        (GUISettings.FONT_TEXT, 28, False, False),
+        (GUISettings.FONT_TEXT, 72, True, False),
+        (GUISettings.FONT_TEXT, 16, True, False),
+        (GUISettings.FONT_TEXT, 18, True, False),
+        (GUISettings.FONT_TEXT, 24, False, False),
+        (GUISettings.FONT_TEXT, 14, True, False),
+        ("arial", 15, True, False),
+        ("sans-serif", 14, True, False),
+        (None, 28, False, False),
+    ]
+
+    @staticmethod
+    def get_font(name, size, bold=False, italic=False):
+        """Fuente memoizada por (nombre, tamano, bold, italic).
+        name=None usa la fuente por defecto de pygame."""
+        key = (name.lower() if name else None, size, bold, italic)
+        font = Assets._fonts_cache.get(key)
+        if font is not None:
+            return font
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+        else:
+            font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        Assets._fonts_cache[key] = font
+        return font
+
+    @staticmethod
+    def warm_up_fonts(specs=None):
+        """Carga de antemano las fuentes habituales para que la primera
+        escena no pague la busqueda de fuentes del sistema."""
+        for name, size, bold, italic in (specs or Assets._FONT_WARMUP):
+            Assets.get_font(name, size, bold, italic)
+
+    @staticmethod
+    def _get_archive():
+        """assets.pak mapeado en memoria, o None si se trabaja con los
+        ficheros sueltos."""
+        if Assets._archive is None:
+            Assets._archive = False
+            if os.path.exists(ARCHIVE_PATH):
+                try:
+                    Assets._archive = AssetArchive(ARCHIVE_PATH)
+                except Exception as e:
+                    print(f"Error abriendo {ARCHIVE_PATH}, se usan los ficheros sueltos: {e}")
+                else:
+                    # Una sola pasada al abrir: despues cargar un asset no toca el disco
+                    Assets._archive_stale = frozenset(Assets._archive.stale(ASSETS_PATH))
+                    if Assets._archive_stale:
+                        print(f"{len(Assets._archive_stale)} ficheros sueltos mas nuevos que {ARCHIVE_PATH}, "
+                              f"se usan en su lugar (vuelve a ejecutar asset_archive.py): "
+                              f"{', '.join(sorted(Assets._archive_stale))}")
+        return Assets._archive or None
+
+    @staticmethod
+    def _archive_name(full_path):
+        """Nombre de full_path dentro de assets.pak, o None si no esta
+        empaquetado o si el fichero suelto ya era mas nuevo al abrir el
+        archivo: entonces gana el suelto."""
+        archive = Assets._get_archive()
+        if archive is None:
+            return None
+        rel = os.path.relpath(full_path, ASSETS_PATH).replace(os.sep, "/")
+        if rel not in archive or rel in Assets._archive_stale:
+            return None
+        return rel
+
+    @staticmethod
+    def _open_asset(path, name):
+        """Fichero path/name: un BytesIO sobre el archivo empaquetado si
+        esta dentro y al dia, o la ruta suelta si no. Seguro desde hilos de
+        trabajo."""
+        full_path = os.path.join(path, name)
+        rel = Assets._archive_name(full_path)
+        if rel is not None:
+            return io.BytesIO(Assets._archive.view(rel))
+        return full_path
+
+    @staticmethod
+    def _decode_image(key):
+        """Lee y decodifica el fichero. Seguro desde hilos de trabajo."""
+        name, path, _ = Assets._IMAGE_DATA[key]
+        return pygame.image.load(Assets._open_asset(path, name), name)
+
+    # ─── CACHE DE PIXELES EN DISCO ────────────────────────────
+
+    @staticmethod
+    def _get_raw_format():
+        """Formato de pixeles de convert_alpha en esta pantalla, o None si
+        no hay pantalla o no es uno que frombuffer sepa reconstruir."""
+        if Assets._raw_format is None:
+            if not AssetSettings.RAW_CACHE_ENABLED or not pygame.display.get_surface():
+                return None
+            probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            Assets._raw_format = _RAW_FORMATS.get(tuple(probe.get_masks()), False)
+        return Assets._raw_format or None
+
+    @staticmethod
+    def _source_hash(key):
+        digest = Assets._source_hashes.get(key)
+        if digest is None:
+            name, path, _ = Assets._IMAGE_DATA[key]
+            rel = Assets._archive_name(os.path.join(path, name))
+            if rel is not None:
+                digest = Assets._archive.index[rel]["sha1"]
+            else:
+                with open(os.path.join(path, name), "rb") as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()
+            Assets._source_hashes[key] = digest
+        return digest
+
+    @staticmethod
+    def _raw_image_path(key, fmt):
+        scale = Assets._IMAGE_DATA[key][2]
+        size = f"{scale[0]}x{scale[1]}" if scale else "orig"
+        return os.path.join(RAW_CACHE_PATH, f"{key}_{Assets._source_hash(key)[:16]}_{size}_{fmt}.raw")
+
+    @staticmethod
+    def _read_raw_image(key):
+        """Superficie final (convertida y escalada) desde la cache en disco,
+        o None. El fichero se mapea copy-on-write: frombuffer no copia los
+        pixeles y escribir en la superficie no toca el fichero."""
+        fmt = Assets._get_raw_format()
+        if fmt is None:
+            return None
+        try:
+            raw_path = Assets._raw_image_path(key, fmt)
+            if not os.path.exists(raw_path):
+                return None
+            with open(raw_path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, w, h = RAW_HEADER.unpack_from(data, 0)
+            if magic != RAW_MAGIC or len(data) != RAW_HEADER.size + w * h * 4:
+                return None
+            return pygame.image.frombuffer(memoryview(data)[RAW_HEADER.size:], (w, h), fmt)
+        except Exception as e:
+            print(f"Error leyendo cache de pixeles de {key}: {e}")
+            return None
+
+    @staticmethod
+    def _write_raw_image(key, img):
+        fmt = Assets._get_raw_format()
+        if fmt is None or tuple(img.get_masks()) not in _RAW_FORMATS:
+            return
+        if img.get_width() * img.get_height() < AssetSettings.RAW_CACHE_MIN_PIXELS:
+            return
+        try:
+            os.makedirs(RAW_CACHE_PATH, exist_ok=True)
+            raw_path = Assets._raw_image_path(key, fmt)
+            tmp_path = raw_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(RAW_HEADER.pack(RAW_MAGIC, *img.get_size()))
+                f.write(pygame.image.tobytes(img, fmt))
+            os.replace(tmp_path, raw_path)
+        except Exception as e:
+            print(f"Error guardando cache de pixeles de {key}: {e}")
+
+    @staticmethod
+    def _load_image_data(key):
+        """(superficie, ya_final): la cache de pixeles si existe o el
+        fichero decodificado si no. Seguro desde hilos de trabajo."""
+        img = Assets._read_raw_image(key)
+        if img is not None:
+            return img, True
+        return Assets._decode_image(key), False
+
+    @staticmethod
+    def _finalize_image(key, img):
+        """convert_alpha + escala y guarda en cache. Solo en el hilo principal."""
+        if pygame.display.get_surface():
+            img = img.convert_alpha()
+        scale = Assets._IMAGE_DATA[key][2]
+        if scale:
+            img = pygame.transform.scale(img, scale)
+        Assets._write_raw_image(key, img)
+        Assets._images_cache[key] = img
+        return img
+
     @staticmethod
     def get_image(key):
-        if key in Assets._images_cache:
-            return Assets._images_cache[key]
+        img = Assets._images_cache.get(key)
+        if img is not None:
+            return img
 
         if key in Assets._IMAGE_DATA:
-            name, path, scale = Assets._IMAGE_DATA[key]
             try:
-                img = pygame.image.load(os.path.join(path, name))
-                if pygame.display.get_surface():
-                    img = img.convert_alpha()
-                if scale:
-                    img = pygame.transform.scale(img, scale)
-                Assets._images_cache[key] = img
-                return img
+                img, from_raw = Assets._load_image_data(key)
+                if from_raw:
+                    Assets._images_cache[key] = img
+                    return img
+                return Assets._finalize_image(key, img)
             except Exception as e:
                 print(f"Error cargando imagen {key}: {e}")
 
@@ -149,28 +479,151 @@ class Assets:
         surf.fill((255, 0, 255))
         return surf
 
+    @staticmethod
+    def get_image_variant(key, size=None, flip_x=False, smooth=False):
+        """Imagen escalada y/o volteada en horizontal, calculada una sola vez
+        por combinacion de parametros. Se guardan en la cache de imagenes con
+        clave (key, size, flip_x, smooth) y cuentan para su presupuesto.
+        Las superficies devueltas son compartidas y no deben modificarse."""
+        if size is None and not flip_x:
+            return Assets.get_image(key)
+
+        size = tuple(size) if size is not None else None
+        vkey = (key, size, flip_x, smooth and size is not None)
+        cache = Assets._images_cache
+        img = cache.get(vkey)
+        if img is not None:
+            return img
+
+        img = Assets.get_image(key)
+        base_loaded = key in Assets._images_cache
+        if flip_x:
+            img = pygame.transform.flip(img, True, False)
+        if size is not None:
+            if smooth:
+                try:
+                    img = pygame.transform.smoothscale(img, size)
+                except ValueError:
+                    # smoothscale solo admite superficies de 24/32 bits
+                    img = pygame.transform.scale(img, size)
+            else:
+                img = pygame.transform.scale(img, size)
+
+        # El fallback magenta de un asset que no carga no se guarda
+        if base_loaded:
+            cache[vkey] = img
+        return img
+
+    @staticmethod
+    def _init_mixer():
+        # Si el mixer no está listo, lo intentamos inicializar
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except:
+                return False
+        return True
+
+    @staticmethod
+    def _decode_sound(key):
+        return pygame.mixer.Sound(file=Assets._open_asset(SFX_PATH, Assets._SOUND_DATA[key]))
+
     @staticmethod
     def get_sound(key):
-        if key in Assets._sounds_cache:
-            return Assets._sounds_cache[key]
+        sound = Assets._sounds_cache.get(key)
+        if sound is not None:
+            return sound
 
         if key in Assets._SOUND_DATA:
-            filename = Assets._SOUND_DATA[key]
-            # Si el mixer no está listo, lo intentamos inicializar
-            if not pygame.mixer.get_init():
-                try:
-                    pygame.mixer.init()
-                except:
-                    return None
+            if not Assets._init_mixer():
+                return None
             
             try:
-                sound_path = os.path.join(SFX_PATH, filename)
-                sound = pygame.mixer.Sound(sound_path)
+                sound = Assets._decode_sound(key)
                 Assets._sounds_cache[key] = sound
                 return sound
             except Exception as e:
                 print(f"Error cargando sonido {key}: {e}")
         return None
+
+    @staticmethod
+    def _stream_pcm_path(key):
+        """Ruta del PCM crudo de un stream en el formato actual del mixer.
+        La primera vez se decodifica el OGG entero una sola vez y se vuelca
+        a disco; despues nunca se vuelve a tener completo en memoria."""
+        freq, size, channels = pygame.mixer.get_init()
+        base = os.path.splitext(Assets._STREAM_DATA[key])[0].replace(" ", "_")
+        pcm_path = os.path.join(STREAM_CACHE_PATH, f"{base}_{freq}_{size}_{channels}.pcm")
+        if not os.path.exists(pcm_path):
+            os.makedirs(STREAM_CACHE_PATH, exist_ok=True)
+            sound = pygame.mixer.Sound(file=Assets._open_asset(SFX_PATH, Assets._STREAM_DATA[key]))
+            tmp_path = pcm_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(sound.get_raw())
+            del sound
+            os.replace(tmp_path, pcm_path)
+        return pcm_path
+
+    @staticmethod
+    def get_stream(key):
+        """SoundStream para un sonido de _STREAM_DATA (ambiente, publico...).
+        Los efectos cortos siguen usando get_sound. Sin precargar con
+        Assets.preload, la primera llamada decodifica el OGG entero."""
+        if key in Assets._streams_cache:
+            return Assets._streams_cache[key]
+
+        if key in Assets._STREAM_DATA:
+            if not Assets._init_mixer():
+                return None
+            try:
+                stream = SoundStream(Assets._stream_pcm_path(key))
+                Assets._streams_cache[key] = stream
+                return stream
+            except Exception as e:
+                print(f"Error cargando stream {key}: {e}")
+        return None
+
+    @staticmethod
+    def update_streams():
+        """Rellena la cola de los streams activos. Se llama una vez por frame."""
+        for stream in Assets._streams_cache.values():
+            stream.update()
+
+    # ─── PRESUPUESTO DE MEMORIA ───────────────────────────────
+
+    @staticmethod
+    def set_scene_pins(keys):
+        """Fija en cache los assets de las escenas activas y libera los de
+        las anteriores para que puedan expulsarse."""
+        keys = set(keys)
+        for key in Assets._scene_pins - keys:
+            Assets._cache_for(key).unpin(key)
+        for key in keys - Assets._scene_pins:
+            Assets._cache_for(key).pin(key)
+        Assets._scene_pins = keys
+
+    @staticmethod
+    def _cache_for(key):
+        return Assets._sounds_cache if key in Assets._SOUND_DATA else Assets._images_cache
+
+    @staticmethod
+    def cache_stats():
+        return {'images': Assets._images_cache.stats(),
+                'sounds': Assets._sounds_cache.stats()}
+
+    @staticmethod
+    def preload(keys, workers=None, wait=True):
+        """Precarga imagenes, sonidos y streams (claves de _IMAGE_DATA /
+        _SOUND_DATA / _STREAM_DATA) en un pool de `workers` hilos. Con
+        wait=False devuelve el PreloadJob sin bloquear; hay que llamar a
+        job.poll() cada frame."""
+        job = PreloadJob(keys, workers)
+        return job.wait() if wait else job
+
+    @staticmethod
+    def startup_keys():
+        """Todo lo que el juego puede pedir durante una partida."""
+        return list(Assets._IMAGE_DATA) + Assets._STARTUP_SOUNDS
     
 
     @staticmethod
@@ -1,16 +1,21 @@
 import pygame
 from assets_manager import Assets
+from rotation_atlas import RotationAtlas
+
+BALL_ROTATION_FRAMES = 64     # fotogramas del atlas de rotacion
+BALL_ROTATION_SMOOTH = False  # True -> rotozoom (mejor calidad)
 
 
 class Ball(pygame.sprite.Sprite):
-    def __init__(self, ballPos=(400, 300), scale=0.8): # Escala reducida para que no sea gigante
+    def __init__(self, ballPos=(400, 300), scale=0.8, # Escala reducida para que no sea gigante
+                 rotation_frames=BALL_ROTATION_FRAMES, smooth_rotation=BALL_ROTATION_SMOOTH):
         super().__init__()
 
         try:
-            img = Assets.get_image("ball").copy()
+            img = Assets.get_image("ball")
             w = int(img.get_width() * scale)
             h = int(img.get_height() * scale)
-            self.image = pygame.transform.scale(img, (w, h))
+            self.image = Assets.get_image_variant("ball", (w, h))
         except Exception:
             size = int(40 * scale)
             self.image = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -21,22 +26,33 @@ class Ball(pygame.sprite.Sprite):
 
         # Box2D body (asignado por factory.py)
         self.body = None
-        self.angle = 0.0
-        self.original_image = self.image.copy()
+        self.original_image = self.image
+        self.rotation_frames = rotation_frames
+        self.smooth_rotation = smooth_rotation
+        self._rotation_atlas = None  # se genera en la primera sincronizacion
 
     def establecerPosicion(self, pos):
         """Sincroniza el sprite con la posición de Box2D."""
         self.rect.centerx = int(pos[0])
         self.rect.centery = int(pos[1])
 
-    def update(self, dt):
-        """Actualiza la rotación visual según la velocidad angular de Box2D."""
-        if self.body:
-            self.angle -= self.body.angularVelocity
-            self.image = pygame.transform.rotate(self.original_image, self.angle)
+    def sync_rotation(self, angle_rad):
+        """Pone el fotograma del atlas que corresponde al angulo del body.
+        MatchScene lo llama al sincronizar el sprite con Box2D."""
+        if self._rotation_atlas is None:
+            self._rotation_atlas = RotationAtlas.get(
+                self.original_image, self.rotation_frames, self.smooth_rotation
+            )
+        image = self._rotation_atlas.frame_for_body(angle_rad)
+        if image is not self.image:
+            self.image = image
             center = self.rect.center
             self.rect = self.image.get_rect()
             self.rect.center = center
 
+    def update(self, dt):
+        if self.body:
+            self.sync_rotation(self.body.angle)
+
     def render(self, screen):
         screen.blit(self.image, self.rect)
\ No newline at end of file
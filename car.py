@@ -17,15 +17,14 @@ class MySprite(pygame.sprite.Sprite):
     def __init__(self, body_key, carPos=(0, 0), scale=1.0, flip=False):
         super().__init__()
         try:
-            body = Assets.get_image(body_key).copy()
-            if flip:
-                body = pygame.transform.flip(body, True, False)
+            body = Assets.get_image(body_key)
+            w, h = int(body.get_width() * scale), int(body.get_height() * scale)
+            self.image = Assets.get_image_variant(body_key, (w, h), flip_x=flip)
         except Exception:
             body = pygame.Surface((80, 50), pygame.SRCALPHA)
             body.fill((200, 50, 50))
-
-        w, h = int(body.get_width() * scale), int(body.get_height() * scale)
-        self.image = pygame.transform.scale(body, (w, h))
+            w, h = int(body.get_width() * scale), int(body.get_height() * scale)
+            self.image = pygame.transform.scale(body, (w, h))
         self.rect = self.image.get_rect()
         self.establecerPosicion(carPos)
         self.body = None
@@ -0,0 +1,170 @@
+"""Reparto de contactos Box2D por categorias de colision.
+
+Un b2World solo admite un contactListener, asi que el ContactDispatcher es
+el unico del mundo y los escenarios le registran rutas. Lee los categoryBits del
+filtro de cada fixture y, con una sola consulta a un dict por sentido,
+encuentra la ruta registrada para ese par de categorias. Durante el
+world.Step solo se apunta el evento en la cola preasignada de la ruta;
+drain() llama a los handlers despues del Step, cuando ya se pueden tocar
+velocidades o destruir cuerpos. Anadir peligros nuevos no encarece el
+reparto: cada uno es una ruta mas en el dict.
+
+Uso:
+    contacts = ContactDispatcher()
+    world.contactListener = contacts
+    contacts.on(CAT_MUD, CAT_PLAYER | CAT_BALL, begin=entra, end=sale)
+    ...
+    world.Step(...)
+    contacts.drain()
+"""
+import Box2D
+
+# ─── CATEGORIAS ──────────────────────────────────────────────
+# Un bit por fixture (categoryBits). maskBits se deja por defecto, asi que
+# las categorias solo sirven para repartir contactos, no para filtrarlos.
+
+CAT_SCENERY  = 0x0001   # categoria por defecto de Box2D: suelo, paredes, porterias
+CAT_PLAYER   = 0x0002
+CAT_BOSS     = 0x0004
+CAT_BALL     = 0x0008
+CAT_FOOT     = 0x0010   # sensor de pie de los coches
+CAT_MUD      = 0x0020
+CAT_CLOUD    = 0x0040
+CAT_TRAPDOOR = 0x0080
+CAT_POWERUP  = 0x0100
+
+CAT_CARS = CAT_PLAYER | CAT_BOSS
+
+QUEUE_CAPACITY = 32   # eventos por ruta y Step antes de tener que crecer
+
+
+def _bits(mask):
+    while mask:
+        bit = mask & -mask
+        yield bit
+        mask ^= bit
+
+
+class ContactEvent:
+    """Evento encolado. body_a es el cuerpo de la categoria con la que se
+    registro la ruta y normal apunta de body_a a body_b (solo en rutas con
+    normal=True). Los eventos se reutilizan: no hay que guardarlos."""
+    __slots__ = ("begin", "body_a", "body_b", "normal")
+
+    def __init__(self):
+        self.begin = False
+        self.body_a = None
+        self.body_b = None
+        self.normal = (0.0, 0.0)
+
+
+class ContactQueue:
+    """Cola de eventos con los objetos preasignados y doble buffer: lo que se
+    encola mientras se vacia (p. ej. EndContact al destruir un cuerpo desde
+    un handler) se queda para el siguiente drain."""
+
+    def __init__(self, capacity=QUEUE_CAPACITY):
+        self._front = [ContactEvent() for _ in range(capacity)]
+        self._back = [ContactEvent() for _ in range(capacity)]
+        self.count = 0
+
+    def push(self, begin, body_a, body_b, normal):
+        events = self._front
+        if self.count == len(events):
+            events.extend(ContactEvent() for _ in range(len(events)))
+        ev = events[self.count]
+        ev.begin = begin
+        ev.body_a = body_a
+        ev.body_b = body_b
+        ev.normal = normal
+        self.count += 1
+
+    def swap(self):
+        """Devuelve (eventos, n) a procesar y deja la cola vacia."""
+        events, n = self._front, self.count
+        self._front, self._back = self._back, events
+        self.count = 0
+        return events, n
+
+
+class _Route:
+    __slots__ = ("queue", "handlers", "normal")
+
+    def __init__(self):
+        self.queue = ContactQueue()
+        self.handlers = []    # [(begin_fn, end_fn)]
+        self.normal = False
+
+
+class ContactDispatcher(Box2D.b2ContactListener):
+    """Listener unico del mundo. Las rutas se indexan por el par ordenado
+    (categoria A << 16 | categoria B) y se resuelven en BeginContact y
+    EndContact con dos consultas al dict, una por sentido."""
+
+    def __init__(self):
+        super().__init__()
+        self._routes = {}
+        self._order = []      # rutas en orden de registro, para drain()
+
+    def on(self, cat_a, cats_b, begin=None, end=None, normal=False):
+        """Registra handlers para los contactos entre cat_a y cualquiera de
+        las categorias de cats_b (mascara). Se llaman desde drain() con un
+        ContactEvent cuyo body_a es el cuerpo de cat_a."""
+        for bit_a in _bits(cat_a):
+            for bit_b in _bits(cats_b):
+                key = bit_a << 16 | bit_b
+                route = self._routes.get(key)
+                if route is None:
+                    route = self._routes[key] = _Route()
+                    self._order.append(route)
+                route.handlers.append((begin, end))
+                route.normal = route.normal or normal
+
+    def _dispatch(self, contact, begin):
+        fixture_a = contact.fixtureA
+        fixture_b = contact.fixtureB
+        cat_a = fixture_a.filterData.categoryBits
+        cat_b = fixture_b.filterData.categoryBits
+        forward = self._routes.get(cat_a << 16 | cat_b)
+        backward = self._routes.get(cat_b << 16 | cat_a) if cat_a != cat_b else None
+        if forward is None and backward is None:
+            return
+
+        normal = (0.0, 0.0)
+        if begin and ((forward is not None and forward.normal)
+                      or (backward is not None and backward.normal)):
+            # El manifold tiene que seguir vivo mientras se lee la normal:
+            # contact.worldManifold.normal sobre el temporal lee memoria liberada
+            manifold = contact.worldManifold
+            nx, ny = manifold.normal
+            normal = (nx, ny)
+
+        # Los b2Body son proxies nuevos en cada acceso: hash/== comparan el
+        # cuerpo C++, asi que valen como clave aunque el cuerpo ya no exista
+        body_a = fixture_a.body
+        body_b = fixture_b.body
+        if forward is not None:
+            forward.queue.push(begin, body_a, body_b, normal)
+        if backward is not None:
+            backward.queue.push(begin, body_b, body_a, (-normal[0], -normal[1]))
+
+    def BeginContact(self, contact):
+        self._dispatch(contact, True)
+
+    def EndContact(self, contact):
+        self._dispatch(contact, False)
+
+    def drain(self):
+        """Llama a los handlers de los eventos encolados, ruta por ruta y en
+        el orden en que llegaron. Va despues de world.Step."""
+        for route in self._order:
+            if not route.queue.count:
+                continue
+            events, n = route.queue.swap()
+            handlers = route.handlers
+            for i in range(n):
+                ev = events[i]
+                for begin_fn, end_fn in handlers:
+                    fn = begin_fn if ev.begin else end_fn
+                    if fn is not None:
+                        fn(ev)
@@ -1,6 +1,7 @@
 import pygame
 from scene import PyGameScene
 from settings import ScreenSettings, GUISettings
+from assets_manager import Assets
 
 
 # Countdown Constants
@@ -26,7 +27,7 @@ class CountdownScene(PyGameScene):
         self.overlay.set_alpha(OVERLAY_ALPHA)
         self.overlay.fill(OVERLAY_COLOR)
 
-        self.countdown_font = pygame.font.SysFont(
+        self.countdown_font = Assets.get_font(
             GUISettings.FONT_TEXT, COUNTDOWN_FONT_SIZE, bold=True
         )
 
@@ -1,5 +1,6 @@
 import pygame
 from settings import DialogueAnimationController
+from assets_manager import Assets
 
 class DialogueUI:
     def __init__(self, name, full_text, portrait, side, font):
@@ -23,6 +24,7 @@ class DialogueUI:
         self.padding_x = 25
         self.padding_y = 20
         self._is_intro_anim = False 
+        self._portrait_small = None  # retrato reescalado, se calcula una vez
 
     def _anim_slide(self, rect, progress):
         offset = (-15 if self._is_intro_anim else 15) * (1.0 - progress)
@@ -56,7 +58,7 @@ class DialogueUI:
             pygame.draw.rect(screen, self.border_color, draw_rect, width=self.border_width, border_radius=8)
 
             if self.name and self.anim_progress > 0.5:
-                name_font = pygame.font.SysFont("arial", 15, bold=True)
+                name_font = Assets.get_font("arial", 15, bold=True)
                 name_surf = name_font.render(self.name.upper(), True, self.name_color)
                 name_rect = name_surf.get_rect()
                 if self.side == 'left': name_rect.topleft = (draw_rect.x + 15, draw_rect.y - 12)
@@ -74,7 +76,9 @@ class DialogueUI:
     def _draw_content(self, screen, rect, current_text, is_last=False):
         draw_y = rect.y; text_margin = 0
         if self.portrait:
-            p_img = pygame.transform.smoothscale(self.portrait, (80, 80)); text_margin = 95
+            if self._portrait_small is None:
+                self._portrait_small = pygame.transform.smoothscale(self.portrait, (80, 80))
+            p_img = self._portrait_small; text_margin = 95
             if self.side == 'right':
                 p_x = rect.right - 80 - self.padding_x; text_x = rect.x + self.padding_x
             else:
@@ -96,7 +100,7 @@ class DialogueUI:
         if is_last and current_text.strip() == self.full_text.strip():
             time_blink = pygame.time.get_ticks() % 1000
             if time_blink > 400:
-                small_font = pygame.font.SysFont("sans-serif", 14, bold=True)
+                small_font = Assets.get_font("sans-serif", 14, bold=True)
                 hint_surf = small_font.render("▼ ESPACIO", True, (120, 120, 120))
                 screen.blit(hint_surf, (rect.right - hint_surf.get_width() - 15, rect.bottom - hint_surf.get_height() - 8))
 
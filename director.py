@@ -1,17 +1,30 @@
 import pygame
 from settings import ScreenSettings, VolumeController
+from profiler import Profiler, PROFILER_TOGGLE_KEY, PROFILER_DUMP_KEY
+from assets_manager import Assets
 from scene import *
 from pygame.locals import *
 
+# La siguiente escena de la campana solo se construye en frames que hayan
+# usado menos de esta fraccion del presupuesto de tiempo por frame
+PREFETCH_IDLE_FRACTION = 0.5
+
 class Director:
     
     def __init__(self):
         self.screen = None
         self.scene_stack = []
         self.exit_scene = False
+        # Ultima escena presentada (para forzar un flip completo al cambiar)
+        self._presented_scene = None
+        # Captura de la escena bajo un overlay: (overlay, escena, superficie)
+        self._overlay_snapshot = None
         # Campaign
         self._campaign_scenes = []
         self._campaign_index = 0
+        # Siguiente escena de la campana preparada por adelantado
+        self._campaign_preload = None   # PreloadJob de sus assets
+        self._campaign_next = None      # escena ya construida
 
     def init_pygame(self):
         pygame.init()
@@ -20,6 +33,7 @@ class Director:
             (ScreenSettings.SCREEN_WIDTH, ScreenSettings.SCREEN_HEIGHT)
         )
         pygame.display.set_caption("Rocket Clash")
+        Assets.warm_up_fonts()
         
         # Initialize volume from saved settings
         VolumeController.initialize_from_settings()
@@ -27,30 +41,91 @@ class Director:
     def buclePygame(self, scene):
         clock = pygame.time.Clock()
         self.exit_scene = False
+        Assets.set_scene_pins(
+            key for s in self.scene_stack for key in getattr(s, "asset_keys", ())
+        )
 
         pygame.event.clear()
 
         while not self.exit_scene:
             delta_time = clock.tick(ScreenSettings.FPS)
+            Profiler.begin_frame()
             events = pygame.event.get()
 
             for ev in events:
                 if ev.type == pygame.QUIT:
                     self.salirPrograma()
                     return
+                if ev.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._presented_scene = None
+                if ev.type == pygame.KEYDOWN:
+                    if ev.key == PROFILER_TOGGLE_KEY:
+                        Profiler.toggle()
+                    elif ev.key == PROFILER_DUMP_KEY and Profiler.enabled:
+                        Profiler.dump_timestamped()
+
+            Assets.update_streams()
 
-            scene.events(events)
-            scene.update(delta_time)
+            with Profiler.section("events"):
+                scene.events(events)
+            with Profiler.section("update"):
+                scene.update(delta_time)
+            if self._campaign_scenes and not self.exit_scene:
+                with Profiler.section("prefetch"):
+                    self._prefetch_campaign(clock.get_rawtime())
 
             # Skip rendering if the scene stack is empty (when exiting game)
             if not self.scene_stack:
+                Profiler.end_frame()
                 continue
             current_scene = self.scene_stack[-1]
-            if (hasattr(current_scene, "is_overlay") and current_scene.is_overlay and len(self.scene_stack) > 1):
-                previous_scene = self.scene_stack[-2]
-                previous_scene.render(self.screen)
-            current_scene.render(self.screen)
-            pygame.display.flip()
+            dirty = self._collect_dirty_rects(current_scene)
+            if dirty is not None and not dirty:
+                # Nada ha cambiado: ni se redibuja ni se presenta
+                Profiler.end_frame()
+                continue
+            with Profiler.section("render"):
+                if (hasattr(current_scene, "is_overlay") and current_scene.is_overlay and len(self.scene_stack) > 1):
+                    self._render_overlay_background(current_scene, self.scene_stack[-2])
+                else:
+                    self._overlay_snapshot = None
+                current_scene.render(self.screen)
+            Profiler.render_overlay(self.screen)
+            with Profiler.section("flip"):
+                if dirty is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(dirty)
+            Profiler.end_frame()
+
+    def _render_overlay_background(self, overlay, previous_scene):
+        """Dibuja la escena bajo un overlay. Mientras el overlay esta arriba la
+        escena de debajo no se actualiza, asi que basta con renderizarla una
+        vez y reutilizar la captura; los overlays con live_background=True
+        la siguen renderizando cada frame."""
+        if getattr(overlay, "live_background", False):
+            self._overlay_snapshot = None
+            previous_scene.render(self.screen)
+            return
+
+        snapshot = self._overlay_snapshot
+        if snapshot is None or snapshot[0] is not overlay or snapshot[1] is not previous_scene:
+            previous_scene.render(self.screen)
+            self._overlay_snapshot = (overlay, previous_scene, self.screen.copy())
+        else:
+            self.screen.blit(snapshot[2], (0, 0))
+
+    def invalidate_overlay_snapshot(self):
+        """Fuerza a volver a capturar la escena bajo el overlay actual."""
+        self._overlay_snapshot = None
+
+    def _collect_dirty_rects(self, scene):
+        """None -> presentar la pantalla completa; lista -> solo esas regiones."""
+        rects = scene.take_dirty_rects() if getattr(scene, "uses_dirty_rects", False) else None
+        if scene is not self._presented_scene or Profiler.overlay_visible:
+            rects = None
+        self._presented_scene = scene
+        return rects
 
     def ejecutar(self):
         self.init_pygame()
@@ -110,20 +185,57 @@ class Director:
     def in_campaign(self):
         return bool(self._campaign_scenes)
 
+    def campaign_step(self, scene_cls, *args):
+        """Factoria para start_campaign que ademas declara los assets de la
+        escena, para precargarlos mientras se juega la anterior."""
+        factory = lambda: scene_cls(self, *args)
+        factory.asset_keys = tuple(scene_cls.preload_keys(*args))
+        return factory
+
+    def _prefetch_campaign(self, frame_work_ms):
+        """Prepara la siguiente escena de la campana en segundo plano: primero
+        precarga sus assets en hilos y despues la construye en un frame con
+        tiempo de sobra, para que advance_campaign solo tenga que apilarla."""
+        if self._campaign_next is not None or self._campaign_index >= len(self._campaign_scenes):
+            return
+        factory = self._campaign_scenes[self._campaign_index]
+        if self._campaign_preload is None:
+            self._campaign_preload = Assets.preload(getattr(factory, "asset_keys", ()), wait=False)
+        if not self._campaign_preload.poll():
+            return
+        if frame_work_ms < 1000.0 / ScreenSettings.FPS * PREFETCH_IDLE_FRACTION:
+            self._campaign_next = factory()
+
+    def _take_campaign_scene(self):
+        """Escena del paso actual: la preparada por _prefetch_campaign o,
+        si no ha dado tiempo, construida ahora."""
+        scene = self._campaign_next
+        if scene is None:
+            if self._campaign_preload is not None:
+                self._campaign_preload.wait()
+            scene = self._campaign_scenes[self._campaign_index]()
+        self._campaign_next = None
+        self._campaign_preload = None
+        self._campaign_index += 1
+        return scene
+
+    def _reset_campaign(self):
+        self._campaign_scenes = []
+        self._campaign_index = 0
+        self._campaign_next = None
+        self._campaign_preload = None
+
     def start_campaign(self, scene_factories):
         """Begin a campaign with a list of scene factory callables."""
+        self._reset_campaign()
         self._campaign_scenes = scene_factories
-        self._campaign_index = 0
         if self._campaign_scenes:
-            scene = self._campaign_scenes[0]()
-            self._campaign_index = 1
-            self.apilarEscena(scene)
+            self.apilarEscena(self._take_campaign_scene())
 
     def advance_campaign(self):
         """Current campaign scene finished successfully. Pop it and push the next one."""
         if self._campaign_index < len(self._campaign_scenes):
-            next_scene = self._campaign_scenes[self._campaign_index]()
-            self._campaign_index += 1
+            next_scene = self._take_campaign_scene()
             # Pop current, push next
             self.pararEscena()
             if self.scene_stack:
@@ -131,15 +243,13 @@ class Director:
             self.scene_stack.append(next_scene)
         else:
             # Campaign complete
-            self._campaign_scenes = []
-            self._campaign_index = 0
+            self._reset_campaign()
             self.exitScene()  # Pop last campaign scene, back to menu
             self._play_main_menu_music()
  
     def fail_campaign(self):
         """Player lost. Abandon campaign and return to main menu."""
-        self._campaign_scenes = []
-        self._campaign_index = 0
+        self._reset_campaign()
         self.pararEscena()
         # Pop everything except the menu (first scene)
         while len(self.scene_stack) > 1:
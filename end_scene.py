@@ -2,6 +2,7 @@ import pygame
 from scene import PyGameScene
 from settings import ScreenSettings, GUISettings, Colors
 from pygame.locals import *
+from assets_manager import Assets
 
 # Result labels. This is not used. In the future, it will be used for declaring a winner or a tie when the game's over.
 RESULT_LABELS = {
@@ -17,9 +18,11 @@ class EndScene(PyGameScene):
         super().__init__(director)
 
         self.result = result
+        # Pantalla estatica: se presenta una vez y luego no se vuelve a dibujar
+        self.uses_dirty_rects = True
 
-        self.title_font = pygame.font.SysFont(GUISettings.FONT_TEXT, 96, bold=True)
-        self.hint_font  = pygame.font.SysFont(GUISettings.FONT_TEXT, 24)
+        self.title_font = Assets.get_font(GUISettings.FONT_TEXT, 96, bold=True)
+        self.hint_font  = Assets.get_font(GUISettings.FONT_TEXT, 24)
 
         label = RESULT_LABELS.get(result, "GAME OVER")
         self.title_surface = self.title_font.render(label, True, Colors.WHITE)
@@ -2,14 +2,45 @@ import Box2D
 import pygame
 from car import PlayerCar, Bulldozer, MotoMoto, LaJenny
 from ball import Ball
+from contact_dispatcher import (CAT_PLAYER, CAT_BOSS, CAT_BALL, CAT_FOOT, CAT_MUD,
+                                CAT_CLOUD, CAT_TRAPDOOR, CAT_POWERUP)
 
 # PPM compartido con match_scene.py
 PPM = 10.0
 
+# Sensor de pie de los coches (deteccion de suelo por contactos)
+FOOT_SENSOR_HALF_HEIGHT = 0.25   # m; sobresale esto por debajo del chasis
+FOOT_SENSOR_WIDTH_RATIO = 0.8    # mas estrecho que el coche: las paredes no cuentan
+
+GROUND_HALF_THICKNESS_PX = 5     # la cara superior del suelo queda en ground_y - esto
+
 def px2m(px): return px / PPM
 def m2px(m):  return m  * PPM
 
 
+class BodyPool:
+    """Cuerpos Box2D de un mismo tipo (barro, nubes...) que al retirarse se
+    desactivan en vez de destruirse, para que RocketFactory los reutilice
+    en la siguiente creacion. Un cuerpo inactivo no esta en la broadphase
+    ni tiene contactos. Guarda como mucho `capacity` cuerpos libres; los
+    que sobren se destruyen."""
+
+    def __init__(self, world, capacity):
+        self.world = world
+        self.capacity = capacity
+        self._free = []
+
+    def acquire(self):
+        return self._free.pop() if self._free else None
+
+    def release(self, body):
+        if len(self._free) < self.capacity:
+            body.active = False
+            self._free.append(body)
+        else:
+            self.world.DestroyBody(body)
+
+
 class RocketFactory:
     @staticmethod
     def create_element(tipo, world, pos, subtipo=None):
@@ -26,14 +57,17 @@ class RocketFactory:
                 box=(3.85, 0.5, (0.0, 0.5), 0),
                 density=10.0,
                 friction=0.08,
-                restitution=0.1
+                restitution=0.1,
+                categoryBits=CAT_PLAYER
             )
             objeto.body.CreatePolygonFixture(
                 vertices=[(-3.0, -1.0), (0.0, -1.0), (0.5, 0.0), (-3.9, 0.0)],
                 density=10.0,
                 friction=0.0,
-                restitution=0.1
+                restitution=0.1,
+                categoryBits=CAT_PLAYER
             )
+            RocketFactory.create_foot_sensor(objeto.body, 3.85, 1.0)
             return objeto
 
         elif tipo == "boss":
@@ -52,12 +86,15 @@ class RocketFactory:
                 linearDamping=0.5
             )
             objeto.body.CreatePolygonFixture(
-                vertices=[(-hw,0), (0,-hh/2),(hw,0)]
+                vertices=[(-hw,0), (0,-hh/2),(hw,0)],
+                categoryBits=CAT_BOSS
             )
             objeto.body.CreatePolygonFixture(
                 box=(hw, hh / 2, (0, hh / 2), 0),
-                density=objeto.mass, friction=0.08, restitution=0.12
+                density=objeto.mass, friction=0.08, restitution=0.12,
+                categoryBits=CAT_BOSS
             )
+            RocketFactory.create_foot_sensor(objeto.body, hw, hh)
             return objeto
 
         elif tipo == "ball":
@@ -71,12 +108,41 @@ class RocketFactory:
                 radius=2,
                 density=0.05,           # mucho más ligero → reacciona más al contacto
                 friction=0.5,
-                restitution=0.9       # rebota más en general
+                restitution=0.9,      # rebota más en general
+                categoryBits=CAT_BALL
             )
             return objeto
 
         return None
 
+    @staticmethod
+    def create_foot_sensor(body, half_width, bottom_y):
+        """Sensor fino bajo el chasis (bottom_y = borde inferior en
+        coordenadas locales). Mientras toque algo estatico el coche esta en
+        el suelo: campo, nubes, techos de porteria..."""
+        return body.CreatePolygonFixture(
+            box=(half_width * FOOT_SENSOR_WIDTH_RATIO, FOOT_SENSOR_HALF_HEIGHT,
+                 (0, bottom_y), 0),
+            isSensor=True,
+            categoryBits=CAT_FOOT
+        )
+
+    # ─── POOL ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _reuse_box(pool, position_m, hw_m, hh_m):
+        """Saca un cuerpo libre del pool y lo recoloca con una caja de
+        hw_m x hh_m. None si no hay pool o esta vacio."""
+        body = pool.acquire() if pool is not None else None
+        if body is not None:
+            # La forma se cambia con el cuerpo inactivo: al activarlo se
+            # vuelve a meter en la broadphase con el AABB nuevo
+            body.fixtures[0].shape.SetAsBox(hw_m, hh_m)
+            body.transform = (position_m, 0)
+            body.linearVelocity = (0, 0)
+            body.active = True
+        return body
+
     # ─── BOUNDARIES ───────────────────────────────────────────
 
     @staticmethod
@@ -87,7 +153,7 @@ class RocketFactory:
 
         # Suelo
         g = world.CreateStaticBody(position=(px2m(screen_width / 2), px2m(ground_y)))
-        g.CreatePolygonFixture(box=(px2m(screen_width / 2), px2m(5)), friction=0.6)
+        g.CreatePolygonFixture(box=(px2m(screen_width / 2), px2m(GROUND_HALF_THICKNESS_PX)), friction=0.6)
         bodies.append(g)
 
         # Techo
@@ -155,76 +221,97 @@ class RocketFactory:
     # ─── MUD (FirstScene) ────────────────────────────────────
 
     @staticmethod
-    def create_mud(world, x_px, w_px, ground_y, mud_height):
-        """Crea un cuerpo sensor estático de barro. Devuelve el body Box2D."""
+    def create_mud(world, x_px, w_px, ground_y, mud_height, pool=None):
+        """Crea un cuerpo sensor estático de barro (o reutiliza uno de pool).
+        Devuelve el body Box2D."""
         cx_m = px2m(x_px + w_px / 2)
         cy_m = px2m(ground_y - mud_height / 2)
         hw_m = px2m(w_px / 2)
         hh_m = px2m(mud_height / 2)
 
+        body = RocketFactory._reuse_box(pool, (cx_m, cy_m), hw_m, hh_m)
+        if body is not None:
+            return body
         body = world.CreateStaticBody(position=(cx_m, cy_m))
         body.CreatePolygonFixture(
             box=(hw_m, hh_m),
             isSensor=True,
-            userData={'type': 'mud'}
+            categoryBits=CAT_MUD
         )
         return body
 
     @staticmethod
-    def destroy_body(world, body):
-        """Destruye un body Box2D de forma segura."""
+    def destroy_body(world, body, pool=None):
+        """Destruye un body Box2D de forma segura, o lo devuelve a pool."""
         if body:
             try:
-                world.DestroyBody(body)
+                if pool is not None:
+                    pool.release(body)
+                else:
+                    world.DestroyBody(body)
             except Exception:
                 pass
 
     # ─── CLOUDS (SecondScene) ─────────────────────────────────
 
     @staticmethod
-    def create_cloud(world, x_px, y_px, w_px, h_px, friction=0.0, restitution=3.0):
-        """Crea un cuerpo estático de nube con alto rebote. Devuelve el body Box2D."""
+    def create_cloud(world, x_px, y_px, w_px, h_px, friction=0.0, restitution=3.0, pool=None):
+        """Crea un cuerpo estático de nube con alto rebote (o reutiliza uno
+        de pool). Devuelve el body Box2D."""
         cx_m = px2m(x_px + w_px / 2)
         cy_m = px2m(y_px + h_px / 2)
         hw_m = px2m(w_px / 2)
         hh_m = px2m(h_px / 2)
 
+        body = RocketFactory._reuse_box(pool, (cx_m, cy_m), hw_m, hh_m)
+        if body is not None:
+            fixture = body.fixtures[0]
+            fixture.friction = friction
+            fixture.restitution = restitution
+            return body
         body = world.CreateStaticBody(position=(cx_m, cy_m))
         body.CreatePolygonFixture(
             box=(hw_m, hh_m),
             friction=friction,
             restitution=restitution,
-            userData={'type': 'cloud'}
+            categoryBits=CAT_CLOUD
         )
         return body
 
     # ─── TRAPDOORS (ThirdScene) ───────────────────────────────
 
     @staticmethod
-    def create_trapdoor_sensor(world, cx_px, y_px, w_px, h_px, index):
-        """Crea un sensor estático para una trapdoor. Devuelve el body Box2D."""
-        body = world.CreateStaticBody(
-            position=(px2m(cx_px), px2m(y_px + h_px / 2))
-        )
+    def create_trapdoor_sensor(world, cx_px, y_px, w_px, h_px, pool=None):
+        """Crea un sensor estático para una trapdoor (o reutiliza uno de
+        pool). Devuelve el body Box2D."""
+        position_m = (px2m(cx_px), px2m(y_px + h_px / 2))
+        body = RocketFactory._reuse_box(pool, position_m, px2m(w_px / 2), px2m(h_px / 2))
+        if body is not None:
+            return body
+        body = world.CreateStaticBody(position=position_m)
         body.CreatePolygonFixture(
             box=(px2m(w_px / 2), px2m(h_px / 2)),
             isSensor=True,
-            userData={'type': 'trapdoor', 'index': index}
+            categoryBits=CAT_TRAPDOOR
         )
         return body
 
     # ─── POWER-UP BOX ─────────────────────────────────────────
 
     @staticmethod
-    def create_powerup_body(world, x_px, size_px):
-        """Crea un body cinemático sensor para la caja de power-up.
-        Devuelve el body Box2D."""
+    def create_powerup_body(world, x_px, size_px, pool=None):
+        """Crea un body cinemático sensor para la caja de power-up (o
+        reutiliza uno de pool). Devuelve el body Box2D."""
         cx_m = px2m(x_px)
         cy_m = px2m(-size_px)  # empieza fuera de pantalla
+        half_m = px2m(size_px / 2)
+        body = RocketFactory._reuse_box(pool, (cx_m, cy_m), half_m, half_m)
+        if body is not None:
+            return body
         body = world.CreateKinematicBody(position=(cx_m, cy_m))
         body.CreatePolygonFixture(
             box=(px2m(size_px / 2), px2m(size_px / 2)),
             isSensor=True,
-            userData={'type': 'powerup'}
+            categoryBits=CAT_POWERUP
         )
         return body
\ No newline at end of file
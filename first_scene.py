@@ -1,11 +1,14 @@
 import pygame
-import random
 import Box2D
 import math
 from Box2D import b2_pi
 from match_scene import MatchScene, px2m, m2px, SW, SH, PPM
 from settings import ScreenSettings
-from factory import RocketFactory
+from factory import RocketFactory, BodyPool
+from contact_dispatcher import CAT_MUD, CAT_BOSS, CAT_PLAYER, CAT_CARS, CAT_BALL
+from profiler import Profiler
+from text_cache import TextCache
+from assets_manager import Assets
 
 # Constantes lógicas del escenario 1, portería izquierda
 GROUND_Y   = 520
@@ -69,83 +72,12 @@ BOSS_STUN_COLOR       = (0, 200, 255)
 POWERUP_READY_COLOR   = (0, 255, 200)
 
 
-# ─── CONTACT LISTENER ────────────────────────────────────────
-
-class SceneContactListener(Box2D.b2ContactListener):
-    """Listener Box2D que detecta:
-       1. Qué bodies están pisando sensores de barro
-       2. Colisiones entre el boss y el jugador (para stun)
-    """
-
-    def __init__(self, scene):
-        super().__init__()
-        self.scene = scene
-        # Barro
-        self.bodies_in_mud = set()
-        self._contact_count = {}
-        # Flag para procesar colisión boss-jugador FUERA del step
-        self.boss_hit_player = False
-
-    def _get_mud_and_other(self, contact):
-        fA = contact.fixtureA
-        fB = contact.fixtureB
-        udA = fA.userData
-        udB = fB.userData
-        if isinstance(udA, dict) and udA.get('type') == 'mud':
-            return fA, fB.body
-        if isinstance(udB, dict) and udB.get('type') == 'mud':
-            return fB, fA.body
-        return None, None
-
-    def _is_boss_player_collision(self, contact):
-        scene = self.scene
-        if not hasattr(scene, 'boss') or not scene.boss.body:
-            return False
-        if not scene.jugador.body:
-            return False
-
-        bodyA = contact.fixtureA.body
-        bodyB = contact.fixtureB.body
-        boss_body = scene.boss.body
-        player_body = scene.jugador.body
-
-        if (bodyA is boss_body and bodyB is player_body):
-            return True
-        if (bodyA is player_body and bodyB is boss_body):
-            return True
-        return False
-
-    def BeginContact(self, contact):
-        # Barro
-        mud_fix, other_body = self._get_mud_and_other(contact)
-        if mud_fix and other_body:
-            body_id = id(other_body)
-            self._contact_count[body_id] = self._contact_count.get(body_id, 0) + 1
-            self.bodies_in_mud.add(other_body)
-            return
-
-        # Boss vs Jugador
-        if self._is_boss_player_collision(contact):
-            self.boss_hit_player = True
-
-    def EndContact(self, contact):
-        mud_fix, other_body = self._get_mud_and_other(contact)
-        if mud_fix and other_body:
-            body_id = id(other_body)
-            count = self._contact_count.get(body_id, 0) - 1
-            if count <= 0:
-                self._contact_count.pop(body_id, None)
-                self.bodies_in_mud.discard(other_body)
-            else:
-                self._contact_count[body_id] = count
-
-    def is_in_mud(self, body):
-        return body in self.bodies_in_mud
-
-
 class FirstScene(MatchScene):
     """Escenario 1: Campo de fútbol clásico verde con Bulldozer."""
 
+    asset_keys = ("player_car", "ball", "bulldozer_car", "stadium1_bg",
+                  "excavator_goalpost_bg", "excavator_goalpost_fg")
+
     def _get_config(self):
         return {
             'ground_y':     GROUND_Y,
@@ -156,16 +88,17 @@ class FirstScene(MatchScene):
             'player_jump':  -28.0,
             'ground_blend': 0.35,
             'air_blend':    0.12,
-            'player_hh':    3.5,
             'goal_pause_ms': 2000,
             'music_name': "match1_bg_playing_theme",
         }
 
     def _init_extras(self):
-        """Crea el Bulldozer, el contact listener y el sistema de barro dinámico."""
-        # Contact listener unificado (barro + colisiones boss)
-        self.contact_listener = SceneContactListener(self)
-        self.world.contactListener = self.contact_listener
+        """Crea el Bulldozer, las rutas de contactos y el sistema de barro dinámico."""
+        # Contactos: barro (b2Body -> nº de contactos) y boss contra jugador
+        self._mud_contacts = {}
+        self.contact_listener.on(CAT_MUD, CAT_CARS | CAT_BALL,
+                                 begin=self._on_mud_begin, end=self._on_mud_end)
+        self.contact_listener.on(CAT_BOSS, CAT_PLAYER, begin=self._on_boss_contact)
 
         # Boss
         self.boss = RocketFactory.create_element(
@@ -173,16 +106,17 @@ class FirstScene(MatchScene):
         )
         self.grupo_sprites.add(self.boss)
 
-        # Barro dinámico
+        # Barro dinámico (cuerpos reutilizados: nunca hay más de MUD_MAX_ACTIVE)
         self.mud_patches = []
+        self.mud_pool = BodyPool(self.world, MUD_MAX_ACTIVE)
         self.mud_spawn_timer = MUD_SPAWN_INTERVAL * 0.5
-        self._mud_next_side = random.choice(['left', 'right'])
+        self._mud_next_side = self.rng.choice(['left', 'right'])
 
         # Stun del jugador (recibido del boss)
         self.player_stunned = False
         self.stun_timer = 0
-        self.stun_font = pygame.font.SysFont('Arial', STUN_FONT_SIZE, bold=True)
-        self.angry_font = pygame.font.SysFont('Arial', 18, bold=True)
+        self.stun_font = Assets.get_font('Arial', STUN_FONT_SIZE, bold=True)
+        self.angry_font = Assets.get_font('Arial', 18, bold=True)
 
         # Control de stun: solo un stun por episodio de enfado
         self._stun_used_this_anger = False
@@ -191,7 +125,22 @@ class FirstScene(MatchScene):
         # Stun al boss (power-up)
         self.boss_stunned = False
         self.boss_stun_timer = 0
-        self.boss_stun_font = pygame.font.SysFont('Arial', STUN_FONT_SIZE, bold=True)
+        self.boss_stun_font = Assets.get_font('Arial', STUN_FONT_SIZE, bold=True)
+
+    # ─── CONTACTOS ───────────────────────────────────────────
+
+    def _on_mud_begin(self, ev):
+        self._mud_contacts[ev.body_b] = self._mud_contacts.get(ev.body_b, 0) + 1
+
+    def _on_mud_end(self, ev):
+        count = self._mud_contacts.get(ev.body_b, 0) - 1
+        if count <= 0:
+            self._mud_contacts.pop(ev.body_b, None)
+        else:
+            self._mud_contacts[ev.body_b] = count
+
+    def _on_boss_contact(self, ev):
+        self._on_boss_hit_player()
 
     # ─── STUN AL JUGADOR ─────────────────────────────────────
 
@@ -295,18 +244,9 @@ class FirstScene(MatchScene):
 
     # ─── OVERRIDE EVENTS (bloquear input si stunned) ─────────
 
-    def events(self, event_list):
+    def _input_locked(self):
         """Bloquea el movimiento del jugador si está stunned."""
-        if self.player_stunned:
-            from pygame.locals import KEYDOWN, K_ESCAPE, K_e
-            from ingame_menu_scene import IngameMenu
-            for ev in event_list:
-                if ev.type == KEYDOWN:
-                    if ev.key == K_ESCAPE:
-                        self.director.apilarEscena(IngameMenu(self.director))
-            return
-
-        super().events(event_list)
+        return self.player_stunned
 
     # ─── BOUNDARIES & GOALS (delegado a RocketFactory) ───────
 
@@ -406,22 +346,23 @@ class FirstScene(MatchScene):
     # ─── BARRO DINÁMICO (delegado a RocketFactory) ───────────
 
     def _create_mud_body(self, x_px, w_px):
-        return RocketFactory.create_mud(self. world, x_px, w_px, GROUND_Y, MUD_HEIGHT)
+        return RocketFactory.create_mud(self.world, x_px, w_px, GROUND_Y, MUD_HEIGHT,
+                                        pool=self.mud_pool)
 
     def _destroy_mud_body(self, body):
-        RocketFactory.destroy_body(self.world, body)
+        RocketFactory.destroy_body(self.world, body, pool=self.mud_pool)
 
     def _spawn_mud_patch(self):
         if len(self.mud_patches) >= MUD_MAX_ACTIVE:
             return
 
-        w = random.randint(MUD_MIN_WIDTH, MUD_MAX_WIDTH)
+        w = self.rng.randint(MUD_MIN_WIDTH, MUD_MAX_WIDTH)
         half = SW // 2
 
         if self._mud_next_side == 'left':
-            x = random.randint(MUD_MARGIN, half - w - MUD_MARGIN)
+            x = self.rng.randint(MUD_MARGIN, half - w - MUD_MARGIN)
         else:
-            x = random.randint(half + MUD_MARGIN, SW - MUD_MARGIN - w)
+            x = self.rng.randint(half + MUD_MARGIN, SW - MUD_MARGIN - w)
 
         x = max(MUD_MARGIN, min(x, SW - MUD_MARGIN - w))
         rect = pygame.Rect(x, GROUND_Y - MUD_HEIGHT, w, MUD_HEIGHT)
@@ -447,9 +388,7 @@ class FirstScene(MatchScene):
         self.mud_patches = alive
 
     def _body_in_mud(self, body):
-        if body and hasattr(self, 'contact_listener'):
-            return self.contact_listener.is_in_mud(body)
-        return False
+        return body is not None and body in self._mud_contacts
 
     def _apply_mud_friction(self):
         if hasattr(self, 'pelota') and self.pelota.body:
@@ -513,35 +452,45 @@ class FirstScene(MatchScene):
 
     # ─── UPDATE ───────────────────────────────────────────────
 
-    def update(self, delta_time):
-        super().update(delta_time)
-
-        # Procesar colisión boss-jugador DESPUÉS del step
-        if hasattr(self, 'contact_listener') and self.contact_listener.boss_hit_player:
-            self.contact_listener.boss_hit_player = False
-            self._on_boss_hit_player()
-
+    def _update_extras(self, step_ms):
         self._track_boss_anger()
         self._check_boss_player_proximity()
 
-        self._update_boss_ai(delta_time)
-        self._update_mud(delta_time)
-        self._apply_mud_friction()
-        self._apply_mud_to_car(self.jugador, MUD_CAR_FRICTION)
-        if hasattr(self, 'boss'):
-            self._apply_mud_to_car(self.boss, MUD_CAR_FRICTION)
-        self._update_stun(delta_time)
-        self._update_boss_stun(delta_time)
+        with Profiler.section("update.ai"):
+            self._update_boss_ai(step_ms)
+        with Profiler.section("update.hazards"):
+            self._update_mud(step_ms)
+            self._apply_mud_friction()
+            self._apply_mud_to_car(self.jugador, MUD_CAR_FRICTION)
+            if hasattr(self, 'boss'):
+                self._apply_mud_to_car(self.boss, MUD_CAR_FRICTION)
+        self._update_stun(step_ms)
+        self._update_boss_stun(step_ms)
 
     # ─── RENDER ───────────────────────────────────────────────
 
+    def _build_static_layers(self, layers):
+        layers.add(self._draw_stadium)
+        layers.add(self._draw_goals_bg)
+
+    def _draw_stadium(self, surface):
+        surface.blit(Assets.get_image("stadium1_bg"), (0, 0))
+
+    def _load_goals_bg(self):
+        size = (GOAL_W, GOAL_H)
+        return ((Assets.get_image_variant("excavator_goalpost_bg", size), (0, GOAL_TOP_Y)),
+                (Assets.get_image_variant("excavator_goalpost_bg", size, flip_x=True),
+                 (SW - GOAL_W, GOAL_TOP_Y)))
+
+    def _draw_goals_bg(self, surface):
+        for img, pos in self._load_goals_bg():
+            surface.blit(img, pos)
+
     def _render_field(self, screen):
-        if not hasattr(self, '_stadium_bg'):
-            bg = pygame.image.load('./assets/stadiums/stadium1_bg.png').convert()
-            self._stadium_bg = pygame.transform.scale(bg, (SW, SH))
-        screen.blit(self._stadium_bg, (0, 0))
+        self.static_layers.blit(screen)
 
         # Barro
+        goals_bg = self._load_goals_bg()
         for patch in self.mud_patches:
             mud_rect = patch['rect']
             life_ratio = 1.0 - (patch['timer'] / MUD_LIFETIME)
@@ -562,34 +511,30 @@ class FirstScene(MatchScene):
                                 (10, mud_rect.height // 2 - 2, 20, 6))
             screen.blit(dec_surf, (mud_rect.x, mud_rect.y))
 
-        if not hasattr(self, '_goalpost_bg'):
-            img = pygame.image.load('./assets/stadiums/excavator_shovel_goalpost_bg.png').convert_alpha()
-            scaled = pygame.transform.scale(img, (GOAL_W, GOAL_H))
-            self._goalpost_bg_l = scaled
-            self._goalpost_bg_r = pygame.transform.flip(scaled, True, False)
-        screen.blit(self._goalpost_bg_l, (0, GOAL_TOP_Y))
-        screen.blit(self._goalpost_bg_r, (SW - GOAL_W, GOAL_TOP_Y))
+            # El fondo de las porterias va por encima del barro: se repinta
+            # solo la zona solapada en lugar de toda la porteria.
+            for img, pos in goals_bg:
+                overlap = mud_rect.clip(img.get_rect(topleft=pos))
+                if overlap:
+                    screen.blit(img, overlap.topleft, overlap.move(-pos[0], -pos[1]))
 
     def _render_field_fg(self, screen):
-        if not hasattr(self, '_goalpost_fg'):
-            img = pygame.image.load('./assets/stadiums/excavator_shovel_goalpost_fg.png').convert_alpha()
-            scaled = pygame.transform.scale(img, (GOAL_W, GOAL_H))
-            self._goalpost_fg_l = scaled
-            self._goalpost_fg_r = pygame.transform.flip(scaled, True, False)
-        screen.blit(self._goalpost_fg_l, (0, GOAL_TOP_Y))
-        screen.blit(self._goalpost_fg_r, (SW - GOAL_W, GOAL_TOP_Y))
+        size = (GOAL_W, GOAL_H)
+        screen.blit(Assets.get_image_variant("excavator_goalpost_fg", size), (0, GOAL_TOP_Y))
+        screen.blit(Assets.get_image_variant("excavator_goalpost_fg", size, flip_x=True),
+                    (SW - GOAL_W, GOAL_TOP_Y))
 
     def render(self, screen):
         """Override para añadir indicadores de stun y enfado del boss."""
-        super().render(screen)
-        
         super().render(screen)
         if not self.is_exiting:
-            if self.player_stunned:
-                self._draw_stun_indicator(screen)
-            if self.boss_stunned:
-                self._draw_boss_stun_indicator(screen)
-            self._draw_angry_indicator(screen)
+            with Profiler.section("render.overlays"):
+                if self.player_stunned:
+                    self._draw_stun_indicator(screen)
+                if self.boss_stunned:
+                    self._draw_boss_stun_indicator(screen)
+            with Profiler.section("render.hud"):
+                self._draw_angry_indicator(screen)
 
     def _draw_stun_indicator(self, screen):
         """Dibuja un indicador visual de aturdimiento sobre el jugador."""
@@ -601,7 +546,7 @@ class FirstScene(MatchScene):
             px = int(m2px(self.jugador.body.position.x))
             py = int(m2px(self.jugador.body.position.y)) - 40
 
-            text = self.stun_font.render("STUNNED!", True, STUN_COLOR)
+            text = TextCache.render(self.stun_font, "STUNNED!", True, STUN_COLOR)
             rect = text.get_rect(center=(px, py))
             screen.blit(text, rect)
 
@@ -632,7 +577,7 @@ class FirstScene(MatchScene):
 
         blink = (pygame.time.get_ticks() // 250) % 2 == 0
         if blink:
-            text = self.boss_stun_font.render("STUNNED!", True, BOSS_STUN_COLOR)
+            text = TextCache.render(self.boss_stun_font, "STUNNED!", True, BOSS_STUN_COLOR)
             rect = text.get_rect(center=(bx, by))
             screen.blit(text, rect)
 
@@ -658,7 +603,7 @@ class FirstScene(MatchScene):
             return
 
         if self.boss_stunned:
-            text = self.angry_font.render("⚡ Bulldozer STUNNED!", True, BOSS_STUN_COLOR)
+            text = TextCache.render(self.angry_font, "⚡ Bulldozer STUNNED!", True, BOSS_STUN_COLOR)
             rect = text.get_rect(topright=ANGRY_INDICATOR_POS)
             bg = pygame.Surface((rect.width + 16, rect.height + 8), pygame.SRCALPHA)
             bg.fill((0, 0, 0, 160))
@@ -668,7 +613,7 @@ class FirstScene(MatchScene):
             blink = (pygame.time.get_ticks() // 400) % 2 == 0
             color = ANGRY_INDICATOR_COLOR if blink else (200, 30, 30)
 
-            text = self.angry_font.render("⚠ BULLDOZER ENFADADO!", True, color)
+            text = TextCache.render(self.angry_font, "⚠ BULLDOZER ENFADADO!", True, color)
             rect = text.get_rect(topright=ANGRY_INDICATOR_POS)
 
             bg = pygame.Surface((rect.width + 16, rect.height + 8), pygame.SRCALPHA)
@@ -676,7 +621,7 @@ class FirstScene(MatchScene):
             screen.blit(bg, (rect.x - 8, rect.y - 4))
             screen.blit(text, rect)
         else:
-            text = self.angry_font.render("Bulldozer: calmado", True, (150, 255, 150))
+            text = TextCache.render(self.angry_font, "Bulldozer: calmado", True, (150, 255, 150))
             rect = text.get_rect(topright=ANGRY_INDICATOR_POS)
 
             bg = pygame.Surface((rect.width + 16, rect.height + 8), pygame.SRCALPHA)
@@ -55,7 +55,7 @@ class Button(GUIElement):
 
         if self.text:
             if self._font is None:
-                self._font = pygame.font.SysFont(self.font_name, self.font_size)
+                self._font = Assets.get_font(self.font_name, self.font_size)
 
             # Render text centered on button
             label_surf = self._font.render(self.text, True, self.border_color)
@@ -74,14 +74,13 @@ class GUIScreen:
         self._update_selection()
 
     def _update_selection(self):
-        # Desmarcar todos los botones
-        for element in self.GUIElements:
+        # Marcar solo el botón seleccionado y pedir redibujar los que cambian
+        for index, element in enumerate(self.GUIElements):
             if isinstance(element, Button):
-                element.hover = False
-        # Marcar el botón seleccionado
-        if self.GUIElements and self.selected_index < len(self.GUIElements):
-            if isinstance(self.GUIElements[self.selected_index], Button):
-                self.GUIElements[self.selected_index].hover = True
+                hover = index == self.selected_index
+                if element.hover != hover:
+                    element.hover = hover
+                    self.menu.mark_dirty(element.base_rect)
 
     def events(self, event_list):
         for event in event_list:
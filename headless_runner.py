@@ -0,0 +1,283 @@
+"""Simulacion de partidos sin ventana (driver de video 'dummy' de SDL).
+
+Construye una variante headless de FirstScene / SecondScene / ThirdScene que
+nunca renderiza ni carga musica, y la avanza a paso fijo tan rapido como
+permita la CPU. El input del jugador lo decide una politica (scripted o IA)
+y se inyecta como eventos KEYDOWN/KEYUP por MatchScene.events, de modo que
+los stuns y bloqueos de input se comportan igual que en el juego real.
+
+Uso:
+    python headless_runner.py --scene first --matches 10 --policy chase
+"""
+import os
+import sys
+import time
+import struct
+import hashlib
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from pygame.locals import KEYDOWN, KEYUP, K_LEFT, K_RIGHT, K_UP, K_e
+from director import Director
+from settings import GameSettings
+from replay import ReplayRecorder, FLAG_DETERMINISTIC, FLAG_NO_INTRO
+
+# Accion -> tecla que MatchScene.events entiende
+ACTION_KEYS = {
+    'left':    K_LEFT,
+    'right':   K_RIGHT,
+    'jump':    K_UP,
+    'powerup': K_e,
+}
+
+
+def _scene_classes():
+    from first_scene import FirstScene
+    from second_scene import SecondScene
+    from third_scene import ThirdScene
+    return {'first': FirstScene, 'second': SecondScene, 'third': ThirdScene}
+
+
+def init_headless():
+    """Inicializa solo los subsistemas de pygame que necesita la simulacion."""
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+# ─── POLITICAS DE INPUT ──────────────────────────────────────
+
+class IdlePolicy:
+    """No pulsa nada."""
+
+    def __call__(self, scene):
+        return set()
+
+
+class ScriptedPolicy:
+    """Reproduce un guion [(tick, {'left', 'jump', ...}), ...].
+    Cada entrada fija las acciones activas desde ese tick en adelante."""
+
+    def __init__(self, script):
+        self.script = sorted(script, key=lambda e: e[0])
+        self._index = 0
+        self._current = set()
+        self._tick = 0
+
+    def __call__(self, scene):
+        while self._index < len(self.script) and self.script[self._index][0] <= self._tick:
+            self._current = set(self.script[self._index][1])
+            self._index += 1
+        self._tick += 1
+        return self._current
+
+
+class ChaseBallPolicy:
+    """IA sencilla: se coloca detras del balon para empujarlo hacia la
+    porteria derecha, salta si el balon esta encima y usa el power-up."""
+
+    def __init__(self, behind_m=3.0, dead_zone_m=0.8):
+        self.behind_m = behind_m
+        self.dead_zone_m = dead_zone_m
+
+    def __call__(self, scene):
+        actions = set()
+        player = scene.jugador.body
+        ball = scene.pelota.body
+        if not player or not ball:
+            return actions
+
+        target_x = ball.position.x - self.behind_m
+        diff = target_x - player.position.x
+        if diff > self.dead_zone_m:
+            actions.add('right')
+        elif diff < -self.dead_zone_m:
+            actions.add('left')
+
+        near_x = abs(ball.position.x - player.position.x) < 5.0
+        if near_x and ball.position.y < player.position.y - 2.0:
+            actions.add('jump')
+
+        if scene.player_has_powerup:
+            actions.add('powerup')
+        return actions
+
+
+POLICIES = {
+    'idle':  IdlePolicy,
+    'chase': ChaseBallPolicy,
+}
+
+
+# ─── ESCENA HEADLESS ─────────────────────────────────────────
+
+class HeadlessMatchMixin:
+    """Anula render y musica y registra estadisticas del partido."""
+
+    def _init_extras(self):
+        self.replay_recorder = None   # run_match graba solo si se le pide
+        self.stats = {'goals': [], 'powerups_collected': 0, 'kickoffs': 0,
+                      'boss_states': {}}
+        self._last_score = (0, 0)
+        super()._init_extras()
+
+    def _elapsed_ms(self):
+        return GameSettings.MATCH_DURATION * 1000 - self.time_remaining_ms
+
+    def _start_background_music(self):
+        pass
+
+    def _stop_background_music(self):
+        pass
+
+    def save_replay(self):
+        pass
+
+    def _on_goal(self):
+        side = 'left' if self.score_left > self._last_score[0] else 'right'
+        self.stats['goals'].append((round(self._elapsed_ms()), side))
+        self._last_score = (self.score_left, self.score_right)
+        super()._on_goal()
+
+    def _on_powerup_collected(self):
+        self.stats['powerups_collected'] += 1
+        super()._on_powerup_collected()
+
+    def _do_kickoff(self):
+        self.stats['kickoffs'] += 1
+        super()._do_kickoff()
+
+    def _update_extras(self, step_ms):
+        super()._update_extras(step_ms)
+        # Histograma de estados de la FSM del boss (ticks en cada estado)
+        boss = getattr(self, 'boss', None)
+        if boss is not None:
+            states = self.stats['boss_states']
+            states[boss.state] = states.get(boss.state, 0) + 1
+
+    def render(self, screen):
+        pass
+
+
+def make_headless(scene_cls):
+    """Devuelve una subclase de scene_cls que no renderiza."""
+    return type("Headless" + scene_cls.__name__, (HeadlessMatchMixin, scene_cls), {})
+
+
+def _events_for(previous, current):
+    events = []
+    for action in current - previous:
+        events.append(pygame.event.Event(KEYDOWN, key=ACTION_KEYS[action], mod=0))
+    for action in previous - current:
+        events.append(pygame.event.Event(KEYUP, key=ACTION_KEYS[action], mod=0))
+    return events
+
+
+def state_digest(scene):
+    """sha1 de la posicion, angulo y velocidades de todos los cuerpos del
+    mundo. Dos partidos con la misma semilla y el mismo input deben dar
+    exactamente el mismo digest."""
+    h = hashlib.sha1()
+    for body in scene.world.bodies:
+        h.update(struct.pack("<6d", body.position.x, body.position.y, body.angle,
+                             body.linearVelocity.x, body.linearVelocity.y,
+                             body.angularVelocity))
+    return h.hexdigest()
+
+
+def skip_intro(scene):
+    """Sin fade ni cuenta atras: se empieza a jugar en el primer tick."""
+    scene.fade_alpha = 0
+    scene.fade_mode = None
+    scene.waiting_for_intro = False
+
+
+def match_result(scene, scene_cls, ticks, wall_s):
+    return {
+        'scene': scene_cls.__name__,
+        'seed': scene.seed,
+        'score_left': scene.score_left,
+        'score_right': scene.score_right,
+        'ticks': ticks,
+        'sim_ms': round(scene._elapsed_ms()),
+        'wall_s': wall_s,
+        'goals': scene.stats['goals'],
+        'powerups_collected': scene.stats['powerups_collected'],
+        'kickoffs': scene.stats['kickoffs'],
+        'boss_states': scene.stats['boss_states'],
+        'state_digest': state_digest(scene),
+    }
+
+
+def run_match(scene_cls, policy=None, director=None, max_ticks=None, seed=None,
+              record_dir=None):
+    """Simula un partido completo sin ventana, en modo determinista.
+    Con record_dir guarda ahi el replay del partido (replay.py).
+
+    Devuelve un dict con el marcador final y estadisticas del partido."""
+    init_headless()
+    director = director or Director()
+    policy = policy or ChaseBallPolicy()
+
+    scene = make_headless(scene_cls)(director, seed=seed, deterministic=True)
+    director.scene_stack.append(scene)
+    skip_intro(scene)
+    if record_dir:
+        scene.replay_recorder = ReplayRecorder(scene_cls.__name__, scene.seed,
+                                               FLAG_DETERMINISTIC | FLAG_NO_INTRO)
+
+    step_ms = scene.physics_step * 1000.0
+    held = set()
+    ticks = 0
+    start = time.perf_counter()
+
+    while not scene.match_over:
+        if max_ticks is not None and ticks >= max_ticks:
+            break
+        actions = set(policy(scene))
+        scene.events(_events_for(held, actions))
+        # El salto y el power-up son pulsaciones: se sueltan en el tick siguiente
+        held = actions - {'jump', 'powerup'}
+        if actions & {'jump', 'powerup'}:
+            scene.events(_events_for(actions, held))
+        scene.update(step_ms)
+        ticks += 1
+
+    wall_s = time.perf_counter() - start
+    if scene in director.scene_stack:
+        director.scene_stack.remove(scene)
+
+    result = match_result(scene, scene_cls, ticks, wall_s)
+    if record_dir:
+        result['replay'] = scene.replay_recorder.save(record_dir)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulacion headless de partidos")
+    parser.add_argument('--scene', choices=['first', 'second', 'third'], default='first')
+    parser.add_argument('--matches', type=int, default=1)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='chase')
+    parser.add_argument('--seed', type=int, default=None,
+                        help="semilla del primer partido (las siguientes son seed+1...)")
+    parser.add_argument('--record', metavar='DIR', default=None,
+                        help="guarda el replay de cada partido en DIR")
+    args = parser.parse_args(argv)
+
+    scene_cls = _scene_classes()[args.scene]
+    for i in range(args.matches):
+        seed = None if args.seed is None else args.seed + i
+        result = run_match(scene_cls, POLICIES[args.policy](), seed=seed, record_dir=args.record)
+        speedup = result['sim_ms'] / 1000.0 / max(result['wall_s'], 1e-9)
+        print(f"[{i + 1}/{args.matches}] {result['scene']}: "
+              f"{result['score_left']} - {result['score_right']}  "
+              f"goles={result['goals']}  seed={result['seed']}  "
+              f"estado={result['state_digest'][:12]}  x{speedup:.0f} tiempo real")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
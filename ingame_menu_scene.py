@@ -4,6 +4,7 @@ from gui_elements import Button, GUIScreen
 from settings import ScreenSettings, GUISettings, Colors
 from pygame.locals import KEYDOWN, K_ESCAPE
 from settings_scene import SettingsScene
+from assets_manager import Assets
 
 # Ingame Menu Constants
 OVERLAY_ALPHA = 180
@@ -87,6 +88,8 @@ class IngameMenu(PyGameScene):
 
         # Mark this as an overlay scene
         self.is_overlay = True
+        # La partida de debajo esta en pausa: solo cambia la seleccion
+        self.uses_dirty_rects = True
 
         self.gui_screen = IngameMenuGUIScreen(self)
 
@@ -102,7 +105,7 @@ class IngameMenu(PyGameScene):
             center=(ScreenSettings.SCREEN_WIDTH // 2, ScreenSettings.SCREEN_HEIGHT // 2)
         )
 
-        self.title_font = pygame.font.SysFont(GUISettings.FONT_TEXT, 36, bold=True)
+        self.title_font = Assets.get_font(GUISettings.FONT_TEXT, 36, bold=True)
         self.title_text = self.title_font.render("PAUSED", True, TITLE_COLOR)
         self.title_rect = self.title_text.get_rect(
             centerx=ScreenSettings.SCREEN_WIDTH // 2,
@@ -147,6 +150,11 @@ class IngameMenu(PyGameScene):
     def exitToMainMenu(self):
         # Detener la música del partido antes de volver al menú
         pygame.mixer.music.stop()
+
+        # El partido abandonado tambien deja su replay
+        for scene in self.director.scene_stack:
+            if hasattr(scene, 'save_replay'):
+                scene.save_replay()
         
         for scene in self.director.scene_stack:
             if len(self.director.scene_stack) == 1:
@@ -1,10 +1,12 @@
 from director import Director
 from menu import Menu
+from assets_manager import Assets
+from scenes.loading_scene import LoadingScene
 
 screen = None
 
 if __name__ == "__main__":
     director = Director()
-    scene = Menu(director)
+    scene = LoadingScene(director, Assets.startup_keys(), lambda: Menu(director))
     director.apilarEscena(scene)
     director.ejecutar()
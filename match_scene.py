@@ -1,15 +1,21 @@
 import pygame
 import Box2D
 from scene import PyGameScene
-from factory import RocketFactory
+from factory import RocketFactory, BodyPool, GROUND_HALF_THICKNESS_PX
 from ingame_menu_scene import IngameMenu
 from end_scene import EndScene
 from assets_manager import Assets
-from settings import ScreenSettings, GUISettings, Colors, GameSettings, VolumeController
+from settings import ScreenSettings, GUISettings, Colors, GameSettings, PhysicsSettings, VolumeController, ReplaySettings
 from pygame.locals import *
 from pygame import Color
 from physics_debug_renderer import PhysicsDebugRenderer
+from profiler import Profiler
+from text_cache import TextCache
+from static_layers import StaticLayers
+from replay import ReplayRecorder, FLAG_DETERMINISTIC
+from contact_dispatcher import ContactDispatcher, CAT_FOOT, CAT_SCENERY, CAT_CLOUD
 import random
+import math
 import os
 
 # Fisica Box2D
@@ -30,11 +36,38 @@ POWERUP_COLOR          = (255, 200, 0)
 POWERUP_BORDER_COLOR   = (200, 150, 0)
 POWERUP_GLOW_COLOR     = (255, 255, 100, 80)
 
+# --- SOMBRAS ---
+SHADOW_ALPHA      = 110
+SHADOW_W_RATIO    = 0.80
+SHADOW_H_BASE     = 11
+SHADOW_Y_OFFSET   = -3
+SHADOW_CACHE_SIZE = 64
+
+# --- SUELO DE COCHES INCLINADOS O VOLCADOS ---
+FOOT_MAX_ANGLE     = math.radians(45)   # mas alla el pie mira a una pared o al techo
+TILTED_MIN_ANGLE   = math.radians(15)   # apoyado en una esquina, el pie ya no llega al suelo
+TILTED_GROUND_GAP  = 0.3                # m entre el chasis y la linea del campo
+
+_shadow_cache = {}
+
+
+def get_shadow_surface(width, height, alpha=SHADOW_ALPHA):
+    """Elipse de sombra cacheada por (ancho, alto, alpha)."""
+    key = (width, height, alpha)
+    surf = _shadow_cache.get(key)
+    if surf is None:
+        if len(_shadow_cache) >= SHADOW_CACHE_SIZE:
+            _shadow_cache.clear()
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, (0, 0, 0, alpha), (0, 0, width, height))
+        _shadow_cache[key] = surf
+    return surf
+
 
 class PowerUpBox(pygame.sprite.Sprite):
     """Caja de power-up que cae del cielo. Es un sensor Box2D."""
 
-    def __init__(self, world, x_px, ground_y_px, size=POWERUP_BOX_SIZE):
+    def __init__(self, world, x_px, ground_y_px, size=POWERUP_BOX_SIZE, pool=None):
         super().__init__()
         self.size = size
         self.ground_y_px = ground_y_px
@@ -47,7 +80,7 @@ class PowerUpBox(pygame.sprite.Sprite):
         self.rect.centery = 0  # empieza arriba
 
         # Body Box2D - delegado a RocketFactory
-        self.body = RocketFactory.create_powerup_body(world, x_px, size)
+        self.body = RocketFactory.create_powerup_body(world, x_px, size, pool=pool)
         self.body.linearVelocity = (0, POWERUP_FALL_SPEED)
 
         self.collected = False
@@ -60,7 +93,7 @@ class PowerUpBox(pygame.sprite.Sprite):
         # Borde
         pygame.draw.rect(self.image, POWERUP_BORDER_COLOR, (0, 0, s, s), 2, border_radius=4)
         # Simbolo "?"
-        font = pygame.font.SysFont('Arial', s - 8, bold=True)
+        font = Assets.get_font('Arial', s - 8, bold=True)
         symbol = font.render("?", True, (100, 50, 0))
         self.image.blit(symbol, symbol.get_rect(center=(s // 2, s // 2)))
 
@@ -85,11 +118,28 @@ class MatchScene(PyGameScene):
       - _render_field(screen)-> dibujo visual del campo
     Opcionalmente:
       - _on_powerup_collected() -> logica especifica del power-up del escenario
+      - _update_extras(step_ms) -> logica por paso de fisica (boss, peligros...)
+      - _build_static_layers(layers) -> capas fijas del campo (fondo, porterias...)
     """
 
-    def __init__(self, director):
+    def __init__(self, director, seed=None, deterministic=None):
         super().__init__(director)
 
+        # Aleatoriedad propia de la partida: misma semilla + mismo input ->
+        # misma simulacion. Toda la logica del partido usa self.rng.
+        if seed is None:
+            seed = PhysicsSettings.MATCH_SEED
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.deterministic = (PhysicsSettings.DETERMINISTIC
+                              if deterministic is None else deterministic)
+        self.replay_recorder = None
+        if ReplaySettings.RECORD:
+            self.replay_recorder = ReplayRecorder(
+                type(self).__name__, seed, FLAG_DETERMINISTIC if self.deterministic else 0)
+
         # Config del escenario
         cfg = self._get_config()
         self.ground_y     = cfg.get('ground_y', 520)
@@ -100,12 +150,25 @@ class MatchScene(PyGameScene):
         self.player_jump  = cfg.get('player_jump', -18.0)
         self.ground_blend = cfg.get('ground_blend', 0.35)
         self.air_blend    = cfg.get('air_blend', 0.12)
-        self.player_hh    = cfg.get('player_hh', 3.5)
         self.goal_pause   = cfg.get('goal_pause_ms', 2000)
 
+        # Paso fijo de fisica
+        self.physics_step  = cfg.get('physics_step', PhysicsSettings.TIME_STEP)
+        self.max_substeps  = cfg.get('max_substeps', PhysicsSettings.MAX_SUBSTEPS)
+        self._physics_accumulator = 0.0
+        self._prev_positions = {}   # sprite -> (x, y) en metros antes del ultimo paso
+
         # Mundo Box2D
         self.world = Box2D.b2World(gravity=self.gravity, doSleep=True)
         self.PHYSICS_DEBUG_MODE = False
+        # Listener unico: cada escenario registra sus rutas en _init_extras
+        self.contact_listener = ContactDispatcher()
+        self.world.contactListener = self.contact_listener
+        # Suelo: sensor de pie contra cualquier fixture solida estatica
+        # (campo, porterias, nubes). b2Body -> nº de contactos
+        self._ground_contacts = {}
+        self.contact_listener.on(CAT_FOOT, CAT_SCENERY | CAT_CLOUD,
+                                 begin=self._on_ground_begin, end=self._on_ground_end)
 
         # Campo y porterias (implementado por subclase)
         self._create_boundaries()
@@ -126,10 +189,15 @@ class MatchScene(PyGameScene):
         # --- Power-up base ---
         self.powerup_spawn_timer = POWERUP_SPAWN_INTERVAL
         self.active_powerup = None          # PowerUpBox actual (o None)
+        self.powerup_pool = BodyPool(self.world, 1)   # nunca hay mas de una caja
         self.player_has_powerup = False     # True si el jugador recogio el power-up
 
+        # Capas estaticas del campo, compuestas en una sola superficie
+        self.static_layers = StaticLayers((SW, SH))
+
         # Hook para que subclases anadan elementos extra (boss, etc.)
         self._init_extras()
+        self._build_static_layers(self.static_layers)
         self._align_boss_visual_with_player()
 
         # Marcador
@@ -151,13 +219,14 @@ class MatchScene(PyGameScene):
         self._kickoff_speed = 6.0
 
         # Fuentes
-        self.font_score = pygame.font.SysFont(GUISettings.FONT_TEXT, 48, bold=True)
-        self.font_timer = pygame.font.SysFont(GUISettings.FONT_TEXT, 28)
-        self.font_goal  = pygame.font.SysFont(GUISettings.FONT_TEXT, 72, bold=True)
-        self.font_powerup = pygame.font.SysFont(GUISettings.FONT_TEXT, 16, bold=True)
+        self.font_score = Assets.get_font(GUISettings.FONT_TEXT, 48, bold=True)
+        self.font_timer = Assets.get_font(GUISettings.FONT_TEXT, 28)
+        self.font_goal  = Assets.get_font(GUISettings.FONT_TEXT, 72, bold=True)
+        self.font_powerup = Assets.get_font(GUISettings.FONT_TEXT, 16, bold=True)
 
-        # Musica de fondo
-        self._start_background_music()
+        # Musica de fondo: arranca en el primer update, porque la escena
+        # puede construirse por adelantado mientras se juega la anterior
+        self._music_started = False
 
         # Countdown inicial
         self.intro_countdown_timer = 3500  # 3.5 segundos (3, 2, 1, YA)
@@ -214,12 +283,20 @@ class MatchScene(PyGameScene):
     def _init_extras(self):
         pass
 
+    def _update_extras(self, step_ms):
+        pass
+
+    def _build_static_layers(self, layers):
+        pass
+
     def _body_px(self, body):
         return (m2px(body.position.x), m2px(body.position.y))
 
     def _get_body_bottom_local_m(self, body):
         bottom = 0.0
         for fixture in body.fixtures:
+            if fixture.sensor:
+                continue
             shape = fixture.shape
             if isinstance(shape, Box2D.b2PolygonShape):
                 y = max(v[1] for v in shape.vertices)
@@ -248,27 +325,55 @@ class MatchScene(PyGameScene):
         boss_sink = self._get_visual_sink_px(boss)
         boss.render_offset_y = player_sink - boss_sink
 
-    def _sync_sprite(self, sprite):
+    def _sync_sprite(self, sprite, alpha=1.0):
+        """Coloca el sprite sobre su body, interpolando entre el paso anterior
+        y el actual segun alpha (fraccion de paso acumulada)."""
         if sprite.body:
             pos = sprite.body.position
+            x, y = pos.x, pos.y
+            prev = self._prev_positions.get(sprite)
+            if prev is not None and alpha < 1.0:
+                x = prev[0] + (x - prev[0]) * alpha
+                y = prev[1] + (y - prev[1]) * alpha
+            sync_rotation = getattr(sprite, 'sync_rotation', None)
+            if sync_rotation is not None:
+                sync_rotation(sprite.body.angle)
             offset_y = getattr(sprite, 'render_offset_y', 0)
-            sprite.establecerPosicion((m2px(pos.x), m2px(pos.y) + offset_y))
+            sprite.establecerPosicion((m2px(x), m2px(y) + offset_y))
 
-    def _check_on_ground(self):
-        if not self.jugador.body:
-            return
-        ground_m = px2m(self.ground_y)
+    def _store_previous_positions(self):
+        for sprite in self.grupo_sprites:
+            body = getattr(sprite, 'body', None)
+            if body:
+                self._prev_positions[sprite] = (body.position.x, body.position.y)
 
-        bottom_m = self.jugador.body.position.y + self.player_hh
-        self.jugador.on_ground = bottom_m >= ground_m - 1.0
+    def _on_ground_begin(self, ev):
+        self._ground_contacts[ev.body_a] = self._ground_contacts.get(ev.body_a, 0) + 1
+
+    def _on_ground_end(self, ev):
+        count = self._ground_contacts.get(ev.body_a, 0) - 1
+        if count <= 0:
+            self._ground_contacts.pop(ev.body_a, None)
+        else:
+            self._ground_contacts[ev.body_a] = count
 
+    def _check_on_ground(self):
+        """on_ground sale de los contactos del sensor de pie con el suelo,
+        mientras el coche este mas o menos derecho (de lado o volcado el pie
+        tocaria paredes y techo). Un coche inclinado o volcado cuenta como en
+        el suelo solo si su chasis esta pegado a la linea del campo, para que
+        pueda saltar y enderezarse sin saltar desde paredes ni techo."""
+        ground_m = px2m(self.ground_y - GROUND_HALF_THICKNESS_PX) - TILTED_GROUND_GAP
         for sprite in self.grupo_sprites:
-            if sprite is self.jugador or sprite is self.pelota:
+            body = getattr(sprite, 'body', None)
+            if not body or not hasattr(sprite, 'on_ground'):
                 continue
-            if hasattr(sprite, 'body') and sprite.body and hasattr(sprite, 'on_ground'):
-                hh = sprite.rect.height / 2 / PPM
-                bottom = sprite.body.position.y + hh
-                sprite.on_ground = bottom >= ground_m - 1.0
+            tilt = abs(math.remainder(body.angle, 2 * math.pi))
+            on_ground = tilt <= FOOT_MAX_ANGLE and body in self._ground_contacts
+            if not on_ground and tilt > TILTED_MIN_ANGLE:
+                on_ground = any(f.GetAABB(0).upperBound.y >= ground_m
+                                for f in body.fixtures if not f.sensor)
+            sprite.on_ground = on_ground
 
     def _apply_player_movement(self):
         if not self.jugador.body:
@@ -322,8 +427,8 @@ class MatchScene(PyGameScene):
         self.pelota.body.linearVelocity = (0, 0)
         self.pelota.body.angularVelocity = 0
 
-        dir_x = random.choice([-1.0, 1.0])
-        vy = random.uniform(-0.5, 0.5)
+        dir_x = self.rng.choice([-1.0, 1.0])
+        vy = self.rng.uniform(-0.5, 0.5)
         vx = dir_x * self._kickoff_speed
         self.pelota.body.linearVelocity = (vx, vy)
 
@@ -355,14 +460,17 @@ class MatchScene(PyGameScene):
         self.pelota.body.angularVelocity  = 0
         self.move_left_flag = False
         self.move_right_flag = False
+        # Tras recolocar no hay que interpolar desde la posicion antigua
+        self._prev_positions.clear()
+        self._physics_accumulator = 0.0
 
     # --- POWER-UP SISTEMA BASE ---
     def _spawn_powerup(self):
         if self.active_powerup is not None:
             return
         margin = 100
-        x = random.randint(margin, SW - margin)
-        box = PowerUpBox(self.world, x, self.ground_y)
+        x = self.rng.randint(margin, SW - margin)
+        box = PowerUpBox(self.world, x, self.ground_y, pool=self.powerup_pool)
         self.active_powerup = box
         self.grupo_sprites.add(box)
 
@@ -370,8 +478,10 @@ class MatchScene(PyGameScene):
         if self.active_powerup is None:
             return
         if self.active_powerup.body:
-            RocketFactory.destroy_body(self.world, self.active_powerup.body)
+            RocketFactory.destroy_body(self.world, self.active_powerup.body,
+                                       pool=self.powerup_pool)
             self.active_powerup.body = None
+        self._prev_positions.pop(self.active_powerup, None)
         self.active_powerup.kill()
         self.active_powerup = None
 
@@ -406,8 +516,6 @@ class MatchScene(PyGameScene):
             self._spawn_powerup()
 
         if self.active_powerup is not None and not self.active_powerup.collected:
-            self._sync_sprite(self.active_powerup)
-
             if self.active_powerup.has_landed():
                 self.active_powerup.body.linearVelocity = (0, 0)
                 ground_m = px2m(self.ground_y - self.active_powerup.size / 2)
@@ -419,7 +527,7 @@ class MatchScene(PyGameScene):
 
     def _render_powerup_hud(self, screen):
         if self.player_has_powerup:
-            text = self.font_powerup.render("POWER-UP LISTO [E]", True, POWERUP_COLOR)
+            text = TextCache.render(self.font_powerup, "POWER-UP LISTO [E]", True, POWERUP_COLOR)
             rect = text.get_rect(topleft=(10, 10))
             bg = pygame.Surface((rect.width + 12, rect.height + 8), pygame.SRCALPHA)
             bg.fill((0, 0, 0, 150))
@@ -427,7 +535,20 @@ class MatchScene(PyGameScene):
             screen.blit(text, rect)
 
     # --- EVENTS ---
+    def _input_locked(self):
+        """True mientras el jugador no puede controlar el coche (stun...).
+        Solo se atiende ESC para pausar."""
+        return False
+
     def events(self, event_list):
+        if self.replay_recorder is not None:
+            self.replay_recorder.feed_events(event_list)
+        if self._input_locked():
+            for ev in event_list:
+                if ev.type == KEYDOWN and ev.key == K_ESCAPE:
+                    self.director.apilarEscena(IngameMenu(self.director))
+            return
+
         for ev in event_list:
             if ev.type == KEYDOWN:
                 if ev.key == K_LEFT or ev.key == K_a:
@@ -455,6 +576,14 @@ class MatchScene(PyGameScene):
 
     # --- UPDATE ---
     def update(self, delta_time):
+        if not self._music_started:
+            self._music_started = True
+            self._start_background_music()
+
+        if self.replay_recorder is not None:
+            self.replay_recorder.end_frame(delta_time)
+        if self.deterministic:
+            delta_time = self.physics_step * 1000.0
         dt_sec = delta_time / 1000.0
         self.update_fade(delta_time)
 
@@ -500,20 +629,45 @@ class MatchScene(PyGameScene):
                 self._reset_positions()
             return
 
-        self._apply_player_movement()
-
-        self.world.Step(1.0 / 60.0, 8, 3)
-        self.world.ClearForces()
-
-        for sprite in self.grupo_sprites:
-            self._sync_sprite(sprite)
+        # Acumulador de paso fijo: la simulacion avanza en pasos de
+        # physics_step independientemente del framerate del render.
+        step = self.physics_step
+        self._physics_accumulator = min(
+            self._physics_accumulator + dt_sec, step * self.max_substeps
+        )
+        while self._physics_accumulator >= step:
+            self._physics_accumulator -= step
+            self._fixed_update(step * 1000.0)
+            if self.goal_scored or self.is_exiting:
+                self._physics_accumulator = 0.0
+                self._prev_positions.clear()
+                break
+
+        alpha = self._physics_accumulator / step
+        with Profiler.section("update.sync"):
+            for sprite in self.grupo_sprites:
+                self._sync_sprite(sprite, alpha)
 
-        self._check_on_ground()
-        self._check_goals()
-        self._check_ball_stuck(delta_time)
-        self._update_powerup(delta_time)
+    def _fixed_update(self, step_ms):
+        """Un paso de simulacion de duracion fija (step_ms)."""
+        self._store_previous_positions()
+        self._apply_player_movement()
 
-        self.time_remaining_ms -= delta_time
+        with Profiler.section("update.physics"):
+            self.world.Step(step_ms / 1000.0,
+                            PhysicsSettings.VELOCITY_ITERATIONS,
+                            PhysicsSettings.POSITION_ITERATIONS)
+            self.world.ClearForces()
+            self.contact_listener.drain()
+
+        with Profiler.section("update.rules"):
+            self._check_on_ground()
+            self._check_goals()
+            self._check_ball_stuck(step_ms)
+            self._update_powerup(step_ms)
+        self._update_extras(step_ms)
+
+        self.time_remaining_ms -= step_ms
         if self.time_remaining_ms <= 0:
             self.time_remaining_ms = 0
             self._start_exit_transition()
@@ -523,11 +677,6 @@ class MatchScene(PyGameScene):
         pass
 
     def _render_shadows(self, screen):
-        SHADOW_COLOR    = (0, 0, 0, 110)
-        SHADOW_W_RATIO  = 0.80
-        SHADOW_H_BASE   = 11
-        SHADOW_Y_OFFSET = -3
-
         shadow_y = self.ground_y - SHADOW_Y_OFFSET
 
         candidates = list(self.shadow_sprites)
@@ -543,8 +692,7 @@ class MatchScene(PyGameScene):
             sw = max(2, int(sprite.rect.width * SHADOW_W_RATIO))
             sh = max(1, SHADOW_H_BASE)
 
-            shadow_surf = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow_surf, SHADOW_COLOR, (0, 0, sw, sh))
+            shadow_surf = get_shadow_surface(sw, sh)
             screen.blit(shadow_surf, (cx - sw // 2, shadow_y - sh // 2))
 
     def render(self, screen):
@@ -552,34 +700,41 @@ class MatchScene(PyGameScene):
         
 
         
-        self._render_field(screen)
-        self._render_shadows(screen)
-        self.grupo_sprites.draw(screen)
-        self._render_field_fg(screen)
+        with Profiler.section("render.field"):
+            self._render_field(screen)
+        with Profiler.section("render.shadows"):
+            self._render_shadows(screen)
+        with Profiler.section("render.sprites"):
+            self.grupo_sprites.draw(screen)
+        with Profiler.section("render.field"):
+            self._render_field_fg(screen)
 
         if not self.is_exiting:
-            self._draw_hud(screen)
-            self._render_powerup_hud(screen)
-            if self.goal_scored:
-                self._draw_goal_text(screen)
+            with Profiler.section("render.hud"):
+                self._draw_hud(screen)
+                self._render_powerup_hud(screen)
+            with Profiler.section("render.overlays"):
+                if self.goal_scored:
+                    self._draw_goal_text(screen)
 
-            if self.waiting_for_intro and self.fade_alpha <= 0:
-                self._draw_intro_countdown(screen)
+                if self.waiting_for_intro and self.fade_alpha <= 0:
+                    self._draw_intro_countdown(screen)
 
-        if self.match_over and not (self.is_exiting and self.fade_alpha >= 255):
-            text_surf = None
-            text_color = Colors.WHITE
+        with Profiler.section("render.overlays"):
+            if self.match_over and not (self.is_exiting and self.fade_alpha >= 255):
+                text_surf = None
+                text_color = Colors.WHITE
 
-            if self.end_phase == "fin":
-                text_surf = self.font_goal.render("FIN DEL PARTIDO", True, Colors.WHITE)
-            elif self.end_phase == "result":
-                text_surf = self.font_goal.render(self.result_text, True, self.result_color)
+                if self.end_phase == "fin":
+                    text_surf = TextCache.render(self.font_goal, "FIN DEL PARTIDO", True, Colors.WHITE)
+                elif self.end_phase == "result":
+                    text_surf = TextCache.render(self.font_goal, self.result_text, True, self.result_color)
 
-            if text_surf is not None:
-                text_rect = text_surf.get_rect(center=(SW // 2, SH // 2))
-                screen.blit(text_surf, text_rect)
+                if text_surf is not None:
+                    text_rect = text_surf.get_rect(center=(SW // 2, SH // 2))
+                    screen.blit(text_surf, text_rect)
 
-        self.draw_fade(screen)
+            self.draw_fade(screen)
 
         renderer = PhysicsDebugRenderer(surface=screen, test=self, world=self.world)
         self.world.renderer = renderer
@@ -601,28 +756,28 @@ class MatchScene(PyGameScene):
         else:
             txt = "YA"
 
-        surf_shadow = self.font_goal.render(txt, True, Colors.BLACK)
-        surf_text = self.font_goal.render(txt, True, Colors.YELLOW)
+        surf_shadow = TextCache.render(self.font_goal, txt, True, Colors.BLACK)
+        surf_text = TextCache.render(self.font_goal, txt, True, Colors.YELLOW)
 
         rect = surf_text.get_rect(center=(SW // 2, SH // 2))
         screen.blit(surf_shadow, (rect.x + 4, rect.y + 4))
         screen.blit(surf_text, rect)
 
     def _draw_hud(self, screen):
-        surf = self.font_score.render(
-            f"{self.score_left}  -  {self.score_right}", True, Colors.WHITE
+        surf = TextCache.render(
+            self.font_score, f"{self.score_left}  -  {self.score_right}", True, Colors.WHITE
         )
         screen.blit(surf, surf.get_rect(centerx=SW // 2, top=12))
 
-        secs = max(0, self.time_remaining_ms // 1000)
+        secs = max(0, int(self.time_remaining_ms // 1000))
         m, s = divmod(secs, 60)
         color = Colors.LIGHT_RED if secs <= 15 else Colors.WHITE
-        tsurf = self.font_timer.render(f"{m}:{s:02d}", True, color)
+        tsurf = TextCache.render(self.font_timer, f"{m}:{s:02d}", True, color)
         screen.blit(tsurf, tsurf.get_rect(centerx=SW // 2, top=66))
 
     def _draw_goal_text(self, screen):
-        shadow = self.font_goal.render("GOL!", True, Colors.BLACK)
-        text = self.font_goal.render("GOL!", True, Colors.YELLOW)
+        shadow = TextCache.render(self.font_goal, "GOL!", True, Colors.BLACK)
+        text = TextCache.render(self.font_goal, "GOL!", True, Colors.YELLOW)
         cx, cy = SW // 2, SH // 2
         screen.blit(shadow, shadow.get_rect(center=(cx + 3, cy + 3)))
         screen.blit(text, text.get_rect(center=(cx, cy)))
@@ -645,6 +800,17 @@ class MatchScene(PyGameScene):
         self.end_phase = "fin"
         self.end_phase_timer_ms = 4000
         self.fade_started = False
+        self.save_replay()
+
+    def save_replay(self):
+        """Guarda el input grabado del partido (una sola vez)."""
+        if self.replay_recorder is None:
+            return
+        try:
+            path = self.replay_recorder.save(ReplaySettings.DIRECTORY, ReplaySettings.KEEP)
+            print(f"Replay guardado en {path}")
+        except OSError as e:
+            print(f"Error guardando replay: {e}")
 
     def _set_wait_timer(self):
         """Activa el tiempo de espera en negro antes de cambiar de escena."""
@@ -82,6 +82,7 @@ class Menu(PyGameScene):
 
     def __init__(self, director):
         PyGameScene.__init__(self, director)
+        self.uses_dirty_rects = True
         self.screenList = []
         
         music_path = Assets.get_music_path("main_menu")
@@ -125,17 +126,17 @@ class Menu(PyGameScene):
 
         d = self.director
         sequence = [
-            lambda: DialogueScene(d, "dialogues/intro.json"),
-            lambda: DialogueScene(d, "dialogues/match1.json"),
-            lambda: FirstScene(d),
-            lambda: DialogueScene(d, "dialogues/match1_end.json"),
-            lambda: DialogueScene(d, "dialogues/match2.json"),
-            lambda: SecondScene(d),
-            lambda: DialogueScene(d, "dialogues/match2_end.json"),
-            lambda: DialogueScene(d, "dialogues/match3.json"),
-            lambda: ThirdScene(d),
-            lambda: DialogueScene(d, "dialogues/match3_end.json"),
-            lambda: CreditsScene(d),
+            d.campaign_step(DialogueScene, "dialogues/intro.json"),
+            d.campaign_step(DialogueScene, "dialogues/match1.json"),
+            d.campaign_step(FirstScene),
+            d.campaign_step(DialogueScene, "dialogues/match1_end.json"),
+            d.campaign_step(DialogueScene, "dialogues/match2.json"),
+            d.campaign_step(SecondScene),
+            d.campaign_step(DialogueScene, "dialogues/match2_end.json"),
+            d.campaign_step(DialogueScene, "dialogues/match3.json"),
+            d.campaign_step(ThirdScene),
+            d.campaign_step(DialogueScene, "dialogues/match3_end.json"),
+            d.campaign_step(CreditsScene),
         ]
         d.start_campaign(sequence)
 
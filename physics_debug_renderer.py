@@ -23,6 +23,8 @@ class PhysicsDebugRenderer(b2DrawExtended):
 
     def render(self):
         for body in self.world.bodies:
+            if not body.active:   # cuerpos guardados en un BodyPool
+                continue
             pos = body.position
             for fixture in body.fixtures: 
                 if isinstance(fixture.shape, b2CircleShape):
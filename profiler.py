@@ -0,0 +1,176 @@
+import os
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from assets_manager import Assets
+
+# Teclas del profiler (gestionadas por el Director)
+PROFILER_TOGGLE_KEY = pygame.K_F3
+PROFILER_DUMP_KEY   = pygame.K_F4
+
+OVERLAY_FONT_SIZE  = 14
+OVERLAY_BG_COLOR   = (0, 0, 0, 170)
+OVERLAY_TEXT_COLOR = (200, 255, 200)
+OVERLAY_WARN_COLOR = (255, 120, 120)
+OVERLAY_POS        = (8, 90)
+FRAME_BUDGET_MS    = 1000.0 / 60.0
+
+
+class _Section:
+    """Context manager que suma el tiempo transcurrido a una seccion del frame."""
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000.0
+        current = Profiler._current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class Profiler:
+    """Instrumentacion por frame. Las secciones se nombran con puntos
+    ('update.physics', 'render.hud'...) y se acumulan dentro de cada frame;
+    se guarda un historico circular para calcular p50/p95/p99."""
+
+    HISTORY = 600  # frames (10 s a 60 FPS)
+
+    enabled = os.environ.get("ROCKET_PROFILE") == "1"
+    overlay_visible = enabled
+
+    _frames = deque(maxlen=HISTORY)
+    _current = {}
+    _frame_start = None   # None: el frame en curso no empezo con el profiler activo
+    _font = None
+
+    @classmethod
+    def section(cls, name):
+        if not cls.enabled:
+            return _NULL_SECTION
+        return _Section(name)
+
+    @classmethod
+    def begin_frame(cls):
+        if not cls.enabled:
+            return
+        cls._current = {}
+        cls._frame_start = time.perf_counter()
+
+    @classmethod
+    def end_frame(cls):
+        if not cls.enabled:
+            return
+        if cls._frame_start is None:
+            # Se activo a mitad de frame (F3): ese frame no se mide
+            cls._current = {}
+            return
+        cls._current["frame"] = (time.perf_counter() - cls._frame_start) * 1000.0
+        cls._frames.append(cls._current)
+        cls._current = {}
+
+    @classmethod
+    def toggle(cls):
+        cls.enabled = not cls.enabled
+        cls.overlay_visible = cls.enabled
+        cls._frame_start = None
+        cls._current = {}
+        if not cls.enabled:
+            cls._frames.clear()
+
+    @classmethod
+    def section_names(cls):
+        names = set()
+        for frame in cls._frames:
+            names.update(frame)
+        return sorted(names)
+
+    @classmethod
+    def percentiles(cls, name, ps=(50, 95, 99)):
+        """Percentiles (nearest-rank) en ms de una seccion. Los frames en los
+        que la seccion no se ejecuto cuentan como 0."""
+        samples = sorted(frame.get(name, 0.0) for frame in cls._frames)
+        if not samples:
+            return tuple(0.0 for _ in ps)
+        n = len(samples)
+        return tuple(samples[min(n - 1, max(0, int(round(p / 100.0 * n)) - 1))] for p in ps)
+
+    @classmethod
+    def summary(cls):
+        return {name: dict(zip(("p50", "p95", "p99"), cls.percentiles(name)))
+                for name in cls.section_names()}
+
+    # ─── VOLCADO ──────────────────────────────────────────────
+
+    @classmethod
+    def dump(cls, path):
+        """Guarda el historico en JSON o CSV segun la extension de path."""
+        names = cls.section_names()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame_index"] + names)
+                for i, frame in enumerate(cls._frames):
+                    writer.writerow([i] + [f"{frame.get(n, 0.0):.4f}" for n in names])
+        else:
+            with open(path, "w") as f:
+                json.dump({"summary": cls.summary(), "assets": Assets.cache_stats(),
+                           "frames": list(cls._frames)}, f, indent=1)
+        return path
+
+    @classmethod
+    def dump_timestamped(cls):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        paths = (cls.dump(f"profile_{stamp}.json"), cls.dump(f"profile_{stamp}.csv"))
+        print(f"Profiler: traza guardada en {paths[0]} y {paths[1]}")
+        return paths
+
+    # ─── OVERLAY ──────────────────────────────────────────────
+
+    @classmethod
+    def render_overlay(cls, screen):
+        if not cls.overlay_visible or not cls._frames:
+            return
+        if cls._font is None:
+            cls._font = Assets.get_font("monospace", OVERLAY_FONT_SIZE)
+
+        lines = [("seccion              p50    p95    p99  ms", OVERLAY_TEXT_COLOR)]
+        for name in cls.section_names():
+            p50, p95, p99 = cls.percentiles(name)
+            color = OVERLAY_WARN_COLOR if p95 > FRAME_BUDGET_MS else OVERLAY_TEXT_COLOR
+            lines.append((f"{name:<18} {p50:6.2f} {p95:6.2f} {p99:6.2f}", color))
+
+        mb = 1024 * 1024
+        for label, st in Assets.cache_stats().items():
+            lines.append((f"{label:<7} {st['bytes'] / mb:6.1f}/{st['budget_bytes'] / mb:.0f} MB "
+                          f"h{st['hits']} m{st['misses']} e{st['evictions']}", OVERLAY_TEXT_COLOR))
+
+        surfaces = [cls._font.render(text, True, color) for text, color in lines]
+        width = max(s.get_width() for s in surfaces) + 12
+        line_h = cls._font.get_linesize()
+        panel = pygame.Surface((width, line_h * len(surfaces) + 8), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BG_COLOR)
+        for i, surf in enumerate(surfaces):
+            panel.blit(surf, (6, 4 + i * line_h))
+        screen.blit(panel, OVERLAY_POS)
@@ -0,0 +1,284 @@
+"""Grabacion y reproduccion de partidos a partir del input.
+
+Un replay guarda la semilla del partido y, por cada frame de MatchScene, el
+input que recibio (bits de teclas mantenidas + pulsaciones) y el delta_time.
+Los frames iguales consecutivos se agrupan (run-length), asi que un partido
+entero ocupa unos pocos KB. Como la simulacion es determinista para una
+semilla y una secuencia de input/dt dadas, reproducir el replay vuelve a
+generar exactamente el mismo partido: sin ventana a cientos de veces tiempo
+real, o renderizado a la velocidad que se quiera.
+
+Uso:
+    python replay.py replays/partida.rcr                 # headless, lo mas rapido posible
+    python replay.py replays/partida.rcr --render --speed 4
+"""
+import os
+import sys
+import glob
+import time
+import struct
+import argparse
+
+import pygame
+from pygame.locals import (KEYDOWN, KEYUP, K_LEFT, K_RIGHT, K_UP, K_a, K_d,
+                           K_w, K_SPACE, K_e, K_ESCAPE)
+
+REPLAY_MAGIC   = b"RCRP"
+REPLAY_VERSION = 1
+REPLAY_EXT     = ".rcr"
+
+_HEADER = struct.Struct("<4sBBqH")  # magic, version, flags, semilla, len(nombre)
+_RUN    = struct.Struct("<BHH")     # bits, dt (ms), frames repetidos
+
+# Flags de cabecera
+FLAG_DETERMINISTIC = 1
+FLAG_NO_INTRO      = 2   # grabado sin fade ni cuenta atras (headless_runner)
+
+# Bits de input por frame
+INPUT_LEFT    = 1
+INPUT_RIGHT   = 2
+INPUT_JUMP    = 4    # pulsaciones: solo el frame en que ocurren
+INPUT_POWERUP = 8
+INPUT_PAUSE   = 16   # informativo: al reproducir no se abre el menu
+HELD_MASK     = INPUT_LEFT | INPUT_RIGHT
+# KEYDOWN de izquierda/derecha en este frame aunque ya estuvieran mantenidas:
+# la escena borra sus flags de movimiento al recolocar tras un gol
+PRESS_SHIFT   = 5
+
+# Mismas teclas que entiende MatchScene.events
+_KEY_BITS = {
+    K_LEFT: INPUT_LEFT, K_a: INPUT_LEFT,
+    K_RIGHT: INPUT_RIGHT, K_d: INPUT_RIGHT,
+    K_UP: INPUT_JUMP, K_w: INPUT_JUMP, K_SPACE: INPUT_JUMP,
+    K_e: INPUT_POWERUP,
+    K_ESCAPE: INPUT_PAUSE,
+}
+# Teclas que se sintetizan al reproducir
+_BIT_KEYS = {INPUT_LEFT: K_LEFT, INPUT_RIGHT: K_RIGHT, INPUT_JUMP: K_UP, INPUT_POWERUP: K_e}
+
+
+class Replay:
+    """Semilla + frames [(bits, dt_ms)] de un partido, en runs comprimidos."""
+
+    def __init__(self, scene_name, seed, flags=0, runs=None):
+        self.scene_name = scene_name
+        self.seed = seed
+        self.flags = flags
+        self.runs = runs if runs is not None else []   # [[bits, dt_ms, count]]
+
+    @property
+    def deterministic(self):
+        return bool(self.flags & FLAG_DETERMINISTIC)
+
+    @property
+    def frame_count(self):
+        return sum(run[2] for run in self.runs)
+
+    def append(self, bits, dt_ms):
+        dt_ms = min(max(int(round(dt_ms)), 0), 0xFFFF)
+        last = self.runs[-1] if self.runs else None
+        if last is not None and last[0] == bits and last[1] == dt_ms and last[2] < 0xFFFF:
+            last[2] += 1
+        else:
+            self.runs.append([bits, dt_ms, 1])
+
+    def frames(self):
+        for bits, dt_ms, count in self.runs:
+            for _ in range(count):
+                yield bits, dt_ms
+
+    # ─── FICHERO ──────────────────────────────────────────────
+
+    def to_bytes(self):
+        name = self.scene_name.encode("utf-8")
+        parts = [_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.flags, self.seed, len(name)), name]
+        parts.extend(_RUN.pack(*run) for run in self.runs)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, flags, seed, name_len = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("No es un replay valido (o es de otra version)")
+        offset = _HEADER.size
+        scene_name = data[offset:offset + name_len].decode("utf-8")
+        offset += name_len
+        runs = [list(run) for run in _RUN.iter_unpack(data[offset:])]
+        return cls(scene_name, seed, flags, runs)
+
+    def save(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Se engancha a MatchScene: feed_events() con los eventos que recibe la
+    escena y end_frame() al principio de cada update."""
+
+    def __init__(self, scene_name, seed, flags=0):
+        self.replay = Replay(scene_name, seed, flags)
+        self._held = 0
+        self._edges = 0
+        self.saved_path = None
+
+    def feed_events(self, event_list):
+        for ev in event_list:
+            if ev.type == KEYDOWN:
+                bit = _KEY_BITS.get(ev.key, 0)
+                if bit & HELD_MASK:
+                    self._held |= bit
+                    self._edges |= bit << PRESS_SHIFT
+                else:
+                    self._edges |= bit
+            elif ev.type == KEYUP:
+                self._held &= ~(_KEY_BITS.get(ev.key, 0) & HELD_MASK)
+
+    def end_frame(self, dt_ms):
+        self.replay.append(self._held | self._edges, dt_ms)
+        self._edges = 0
+
+    def save(self, directory, keep=None):
+        """Guarda el replay en directory (una sola vez) y borra los mas
+        antiguos si hay mas de `keep`."""
+        if self.saved_path is not None:
+            return self.saved_path
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{stamp}_{self.replay.scene_name}_{self.replay.seed}{REPLAY_EXT}"
+        self.saved_path = self.replay.save(os.path.join(directory, name))
+        if keep:
+            old = sorted(glob.glob(os.path.join(directory, "*" + REPLAY_EXT)))[:-keep]
+            for path in old:
+                os.remove(path)
+        return self.saved_path
+
+
+def events_for(previous_bits, bits):
+    """Eventos que reproducen un frame grabado partiendo de previous_bits."""
+    events = []
+    for bit, key in _BIT_KEYS.items():
+        if bit & HELD_MASK:
+            pressed = bits & (bit << PRESS_SHIFT) or (bits & bit and not previous_bits & bit)
+            if pressed:
+                events.append(pygame.event.Event(KEYDOWN, key=key, mod=0))
+            if not bits & bit and (pressed or previous_bits & bit):
+                events.append(pygame.event.Event(KEYUP, key=key, mod=0))
+        elif bits & bit:
+            events.append(pygame.event.Event(KEYDOWN, key=key, mod=0))
+    return events
+
+
+# ─── REPRODUCCION ────────────────────────────────────────────
+
+def _scene_class(scene_name):
+    import headless_runner
+    for cls in headless_runner._scene_classes().values():
+        if cls.__name__ == scene_name:
+            return cls
+    raise ValueError(f"Escena desconocida en el replay: {scene_name}")
+
+
+def _build_scene(replay, scene_cls, director):
+    import headless_runner
+    scene = scene_cls(director, seed=replay.seed, deterministic=replay.deterministic)
+    scene.replay_recorder = None
+    if replay.flags & FLAG_NO_INTRO:
+        headless_runner.skip_intro(scene)
+    director.scene_stack.append(scene)
+    return scene
+
+
+def _step(scene, held, bits, dt_ms):
+    scene.events(events_for(held, bits))
+    scene.update(dt_ms)
+    return bits & HELD_MASK
+
+
+def play_headless(replay, director=None):
+    """Re-simula el replay sin ventana y devuelve el resultado como
+    headless_runner.run_match (incluido state_digest)."""
+    import headless_runner
+    from director import Director
+
+    headless_runner.init_headless()
+    director = director or Director()
+    scene_cls = _scene_class(replay.scene_name)
+    scene = _build_scene(replay, headless_runner.make_headless(scene_cls), director)
+
+    held = 0
+    start = time.perf_counter()
+    for bits, dt_ms in replay.frames():
+        held = _step(scene, held, bits, dt_ms)
+    result = headless_runner.match_result(scene, scene_cls, replay.frame_count,
+                                          time.perf_counter() - start)
+    if scene in director.scene_stack:
+        director.scene_stack.remove(scene)
+    return result
+
+
+def play_rendered(replay, speed=1.0):
+    """Reproduce el replay en una ventana a `speed` veces tiempo real.
+    ESC o cerrar la ventana lo detienen."""
+    from director import Director
+    from settings import ScreenSettings
+
+    director = Director()
+    director.init_pygame()
+    scene = _build_scene(replay, _scene_class(replay.scene_name), director)
+    scene.screen = director.screen
+
+    clock = pygame.time.Clock()
+    frames = replay.frames()
+    held = 0
+    budget = 0.0
+    while True:
+        clock.tick(ScreenSettings.FPS)
+        for ev in pygame.event.get():
+            if ev.type == pygame.QUIT or (ev.type == KEYDOWN and ev.key == K_ESCAPE):
+                pygame.quit()
+                return
+        budget += speed
+        while budget >= 1.0:
+            budget -= 1.0
+            frame = next(frames, None)
+            if frame is None:
+                pygame.quit()
+                return
+            held = _step(scene, held, *frame)
+        scene.render(director.screen)
+        pygame.display.flip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduce un replay de partido")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true", help="reproducir en una ventana")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="frames de simulacion por frame mostrado (con --render)")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    print(f"{replay.scene_name} seed={replay.seed} frames={replay.frame_count} "
+          f"runs={len(replay.runs)}")
+    if args.render:
+        play_rendered(replay, args.speed)
+        return
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    result = play_headless(replay)
+    speedup = result['sim_ms'] / 1000.0 / max(result['wall_s'], 1e-9)
+    print(f"{result['score_left']} - {result['score_right']}  goles={result['goals']}  "
+          f"estado={result['state_digest'][:12]}  x{speedup:.0f} tiempo real")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
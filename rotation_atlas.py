@@ -0,0 +1,55 @@
+import math
+import weakref
+import pygame
+
+DEFAULT_ROTATION_FRAMES = 64
+
+
+class RotationAtlas:
+    """Fotogramas pre-rotados de una imagen.
+
+    Se generan una sola vez (N pasos uniformes en 360 grados) y en cada frame
+    se elige el mas cercano al angulo pedido, en lugar de llamar a
+    pygame.transform.rotate. Con smooth=True se usa rotozoom (filtrado, mas
+    lento de generar pero con mejor calidad). RotationAtlas.get() los
+    comparte por imagen (la misma Surface, p. ej. una variante de Assets);
+    sirve igual para el balon que para los coches si se dibuja su rotacion
+    a partir de body.angle.
+    """
+
+    # Surface -> {(frames, smooth): atlas}. Referencia debil: si Assets
+    # descarta la imagen, su atlas se va con ella
+    _atlases = weakref.WeakKeyDictionary()
+
+    def __init__(self, image, frames=DEFAULT_ROTATION_FRAMES, smooth=False):
+        if frames < 1:
+            raise ValueError("El atlas necesita al menos un fotograma")
+        self.step = 360.0 / frames
+        if smooth:
+            self.frames = [pygame.transform.rotozoom(image, i * self.step, 1.0)
+                           for i in range(frames)]
+        else:
+            self.frames = [pygame.transform.rotate(image, i * self.step)
+                           for i in range(frames)]
+
+    @classmethod
+    def get(cls, image, frames=DEFAULT_ROTATION_FRAMES, smooth=False):
+        """Atlas cacheado por (imagen, frames, smooth)."""
+        by_image = cls._atlases.setdefault(image, {})
+        atlas = by_image.get((frames, smooth))
+        if atlas is None:
+            atlas = by_image[(frames, smooth)] = cls(image, frames, smooth)
+        return atlas
+
+    @classmethod
+    def clear(cls):
+        cls._atlases.clear()
+
+    def frame(self, angle_deg):
+        """Fotograma mas cercano a angle_deg (grados, sentido de pygame)."""
+        return self.frames[int(round(angle_deg / self.step)) % len(self.frames)]
+
+    def frame_for_body(self, angle_rad):
+        """Fotograma para el angulo de un body de Box2D. El eje Y de la
+        pantalla apunta hacia abajo, asi que el giro va en sentido contrario."""
+        return self.frame(-math.degrees(angle_rad))
@@ -16,6 +16,15 @@ class Scene:
 
 
 class PyGameScene(Scene):
+
+    # Claves de Assets que se fijan en cache mientras la escena esta en la pila
+    asset_keys = ()
+
+    @classmethod
+    def preload_keys(cls, *args):
+        """Assets que necesitara una escena construida con estos argumentos
+        (para precargarlos antes de construirla)."""
+        return cls.asset_keys
     
     def __init__(self, director):
         Scene.__init__(self, director)
@@ -24,6 +33,16 @@ class PyGameScene(Scene):
         self.screen = None
         # If True, the scene below will also be rendered
         self.is_overlay = False
+        # Overlays only: if True the scene below is re-rendered every frame
+        # instead of reusing the snapshot taken when the overlay was pushed
+        self.live_background = False
+
+        # --- DIRTY RECTS (opcional) ---
+        # Si uses_dirty_rects es True el Director solo presenta las regiones
+        # marcadas con mark_dirty(), y ninguna si no ha cambiado nada.
+        self.uses_dirty_rects = False
+        self._full_redraw = True
+        self._dirty_rects = []
 
         # --- SISTEMA DE TRANSICIÓN ---
         self.fade_alpha = 0
@@ -64,6 +83,24 @@ class PyGameScene(Scene):
             if self.fade_alpha <= 0:
                 self.fade_mode = None
 
+    def mark_dirty(self, rect=None):
+        """Marca una region para volver a presentarla; sin rect, toda la pantalla."""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def take_dirty_rects(self):
+        """Devuelve None si hay que presentar la pantalla completa o la lista
+        (quizas vacia) de regiones cambiadas, y limpia las marcas."""
+        if self._full_redraw or self.fade_mode or self.fade_alpha > 0:
+            rects = None
+        else:
+            rects = self._dirty_rects
+        self._full_redraw = False
+        self._dirty_rects = []
+        return rects
+
     def draw_fade(self, screen):
         """Dibuja la capa negra superpuesta con el alpha actual."""
         if self.fade_alpha > 0:
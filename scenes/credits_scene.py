@@ -3,30 +3,24 @@ import sys
 import os
 from scene import PyGameScene
 from settings import ScreenSettings, Colors, GUISettings
-from assets_manager import Assets, BACKGROUNDS_PATH
+from assets_manager import Assets
 from pygame.locals import *
 
 class CreditsScene(PyGameScene):
+    asset_keys = ("credits_background",)
+
     def __init__(self, director):
         super().__init__(director)
-        
-        # 1. Registro dinámico de fondo (por si no está en Assets)
-        if "credits_bg" not in Assets._IMAGE_DATA:
-            Assets._IMAGE_DATA["credits_bg"] = (
-                "credits_background.png", 
-                BACKGROUNDS_PATH, 
-                (ScreenSettings.SCREEN_WIDTH, ScreenSettings.SCREEN_HEIGHT)
-            )
 
-        self.background = Assets.get_image("credits_bg")
+        self.background = Assets.get_image("credits_background")
 
         # Configuración de scroll
         self.scroll_speed = 0.9
         self.y_offset = ScreenSettings.SCREEN_HEIGHT
         
         # Fuentes
-        self.font_role = pygame.font.SysFont(GUISettings.FONT_TEXT, 40, italic=True)
-        self.font_name = pygame.font.SysFont(GUISettings.FONT_TEXT, 30)
+        self.font_role = Assets.get_font(GUISettings.FONT_TEXT, 40, italic=True)
+        self.font_name = Assets.get_font(GUISettings.FONT_TEXT, 30)
 
         # Contenido de créditos
         # Añadimos un par de "" al final para dar aire antes del cierre
@@ -9,13 +9,26 @@ from dialogue.dialogue_sound_player import DialogueSoundPlayer
 from settings import DialogueSpeedController
 
 class DialogueScene(PyGameScene):
+    @classmethod
+    def preload_keys(cls, json_path):
+        """Fondo y retratos que usa el dialogo json_path."""
+        return cls._keys_for(DialogueManager(json_path).data)
+
+    @staticmethod
+    def _keys_for(data):
+        keys = [data.get('background', 'background')]
+        for char in data.get('characters', {}).values():
+            portraits = char.get('portraits', {"idle": char.get('portrait_key')})
+            keys.extend(k for k in portraits.values() if k)
+        return keys
+
     def __init__(self, director, json_path):
         super().__init__(director)
         self.screen = getattr(director, "screen", None) or pygame.display.get_surface()
         sw, sh = self.screen.get_size()
 
         # --- CONFIGURACIÓN VISUAL ---
-        self.font = pygame.font.Font(None, 28)
+        self.font = Assets.get_font(None, 28)
         self.fixed_sprite_y = 10 
         self.margin_side = 10
         self.sprite_to_bubble_gap = 10
@@ -24,6 +37,8 @@ class DialogueScene(PyGameScene):
         # --- GESTIÓN DE DIÁLOGOS ---
         self.manager = DialogueManager(json_path)
         self.history = []
+        # Se fijan en cache mientras el dialogo este en la pila
+        self.asset_keys = tuple(self._keys_for(self.manager.data))
         
         chars_data = self.manager.data.get('characters', {})
         num_chars = len(chars_data)
@@ -91,9 +106,7 @@ class DialogueScene(PyGameScene):
             sprites[name] = {"side": side_key, "display_size": (char_w, char_h)}
             for state, asset_key in portraits.items():
                 if asset_key:
-                    img = Assets.get_image(asset_key)
-                    img = pygame.transform.scale(img, (char_w, char_h))
-                    sprites[name][state] = img
+                    sprites[name][state] = Assets.get_image_variant(asset_key, (char_w, char_h))
             if "idle" in sprites[name] and "talk" not in sprites[name]:
                 sprites[name]["talk"] = sprites[name]["idle"]
         return sprites
@@ -0,0 +1,56 @@
+import pygame
+from scene import PyGameScene
+from assets_manager import Assets
+from settings import ScreenSettings, GUISettings, Colors
+
+BACKGROUND_COLOR = (20, 20, 30)
+BAR_WIDTH = 480
+BAR_HEIGHT = 18
+BAR_BG_COLOR = (70, 70, 90)
+BAR_FG_COLOR = (50, 150, 255)
+
+
+class LoadingScene(PyGameScene):
+    """Precarga assets en segundo plano mostrando el progreso real y, al
+    terminar, se sustituye por la escena que devuelve next_scene_factory."""
+
+    def __init__(self, director, keys, next_scene_factory, workers=None):
+        super().__init__(director)
+        self.keys = list(keys)
+        self.next_scene_factory = next_scene_factory
+        self.workers = workers
+        # Se crea en el primer update: hace falta la ventana para convert_alpha
+        self.job = None
+
+        self.title_font = Assets.get_font(GUISettings.FONT_TEXT, 36, bold=True)
+        self.label_font = Assets.get_font(GUISettings.FONT_TEXT, 20)
+
+    def update(self, delta_time):
+        if self.job is None:
+            self.job = Assets.preload(self.keys, self.workers, wait=False)
+        if self.job.poll():
+            self.director.exitScene()
+            self.director.apilarEscena(self.next_scene_factory())
+
+    def events(self, event_list):
+        pass
+
+    def render(self, screen):
+        screen.fill(BACKGROUND_COLOR)
+        cx, cy = ScreenSettings.SCREEN_WIDTH // 2, ScreenSettings.SCREEN_HEIGHT // 2
+
+        title = self.title_font.render("Cargando...", True, Colors.WHITE)
+        screen.blit(title, title.get_rect(center=(cx, cy - 50)))
+
+        progress = self.job.progress if self.job else 0.0
+        bar = pygame.Rect(0, 0, BAR_WIDTH, BAR_HEIGHT)
+        bar.center = (cx, cy)
+        pygame.draw.rect(screen, BAR_BG_COLOR, bar, border_radius=6)
+        if progress > 0:
+            filled = bar.copy()
+            filled.width = max(1, int(BAR_WIDTH * progress))
+            pygame.draw.rect(screen, BAR_FG_COLOR, filled, border_radius=6)
+
+        done = self.job.done if self.job else 0
+        label = self.label_font.render(f"{done} / {len(self.keys)}", True, Colors.WHITE)
+        screen.blit(label, label.get_rect(center=(cx, cy + 40)))
@@ -1,10 +1,13 @@
 import pygame
-import random
 import Box2D
 import math
 from match_scene import MatchScene, px2m, m2px, SW, SH, PPM
 from settings import ScreenSettings
-from factory import RocketFactory
+from factory import RocketFactory, BodyPool
+from contact_dispatcher import CAT_CLOUD, CAT_CARS, CAT_BALL
+from profiler import Profiler
+from text_cache import TextCache
+from assets_manager import Assets
 
 
 
@@ -67,83 +70,15 @@ POWERUP_FLASH_DURATION = 400
 POWERUP_READY_COLOR    = (0, 255, 200)
 
 
-# ─── CONTACT LISTENER ────────────────────────────────────────
-
-class Scene2ContactListener(Box2D.b2ContactListener):
-    """
-    Listener Box2D para el escenario 2.
-    Detecta colisiones con nubes y encola impulsos de rebote extra
-    que se aplican DESPUÉS del world.Step.
-    """
-
-    def __init__(self, scene):
-        super().__init__()
-        self.scene = scene
-        self._pending_bounces = []
-
-    def _get_cloud_contact(self, contact):
-        fA = contact.fixtureA
-        fB = contact.fixtureB
-        udA = fA.userData
-        udB = fB.userData
-
-        cloud_is_A = isinstance(udA, dict) and udA.get('type') == 'cloud'
-        cloud_is_B = isinstance(udB, dict) and udB.get('type') == 'cloud'
-
-        if not (cloud_is_A or cloud_is_B):
-            return None
-
-        cloud_body   = fA.body if cloud_is_A else fB.body
-        dynamic_body = fB.body if cloud_is_A else fA.body
-        if dynamic_body.type != Box2D.b2_dynamicBody:
-            return None
-
-        try:
-            nx, ny = contact.worldManifold.normal
-        except Exception:
-            nx, ny = 0.0, -1.0
-
-        if cloud_is_B:
-            nx, ny = -nx, -ny
-
-        return (dynamic_body, nx, ny, cloud_body)
-
-    def BeginContact(self, contact):
-        result = self._get_cloud_contact(contact)
-        if result:
-            body, nx, ny, cloud_body = result
-            self._pending_bounces.append((body, nx, ny, cloud_body))
-
-    def EndContact(self, contact):
-        pass
-
-    def apply_pending_bounces(self):
-        hit_cloud_bodies = set()
-        for body, nx, ny, cloud_body in self._pending_bounces:
-            try:
-                ix = nx * CLOUD_BOUNCE_IMPULSE
-                iy = ny * CLOUD_BOUNCE_IMPULSE
-
-                if abs(ny) < 0.3:
-                    iy = -abs(CLOUD_BOUNCE_IMPULSE) * 0.6
-
-                body.ApplyLinearImpulse(
-                    impulse=(ix, iy),
-                    point=body.worldCenter,
-                    wake=True
-                )
-                hit_cloud_bodies.add(cloud_body)
-            except Exception:
-                pass
-        self._pending_bounces.clear()
-        return hit_cloud_bodies
-
-
 # ─── SECOND SCENE ────────────────────────────────────────────
 
 class SecondScene(MatchScene):
     """Escenario 2: MotoMoto + nubes negras rebotadoras + power-up pelotazo."""
 
+    asset_keys = ("player_car", "ball", "moto_moto_car", "stadium2_bg",
+                  "container_left_yellow_bg", "container_left_yellow_fg",
+                  "container_right_green_bg", "container_right_green_fg")
+
     def _get_config(self):
         return {
             'ground_y':      GROUND_Y,
@@ -154,7 +89,6 @@ class SecondScene(MatchScene):
             'player_jump':   -28.0,
             'ground_blend':  0.35,
             'air_blend':     0.12,
-            'player_hh':     3.5,
             'goal_pause_ms': 2000,
             'music_name': "match2_bg_playing_theme"
         }
@@ -163,8 +97,11 @@ class SecondScene(MatchScene):
 
     def _init_extras(self):
         """Crea a MotoMoto, el contact listener, las nubes y el sistema de pelotazo."""
-        self.contact_listener = Scene2ContactListener(self)
-        self.world.contactListener = self.contact_listener
+        # Rebotes extra en las nubes: se aplican al vaciar la cola, despues
+        # del world.Step, y las nubes golpeadas se retiran en _update_cloud_hits
+        self._hit_clouds = set()
+        self.contact_listener.on(CAT_CLOUD, CAT_CARS | CAT_BALL,
+                                 begin=self._on_cloud_contact, normal=True)
 
         # Boss
         self.boss = RocketFactory.create_element(
@@ -173,8 +110,8 @@ class SecondScene(MatchScene):
         self.grupo_sprites.add(self.boss)
 
         # Fuentes para indicadores
-        self.angry_font = pygame.font.SysFont('Arial', 18, bold=True)
-        self.kick_font  = pygame.font.SysFont('Arial', 18, bold=True)
+        self.angry_font = Assets.get_font('Arial', 18, bold=True)
+        self.kick_font  = Assets.get_font('Arial', 18, bold=True)
 
         # ─── Teletransporte ───────────────────────────────────
         self.teleport_flash_timer = 0
@@ -186,6 +123,7 @@ class SecondScene(MatchScene):
 
         # ─── Nubes ────────────────────────────────────────────
         self.clouds            = []
+        self.cloud_pool        = BodyPool(self.world, CLOUD_MAX_ACTIVE)
         self.cloud_spawn_timer = CLOUD_SPAWN_INTERVAL * 0.3
 
         # ─── Pelotazo (power-up) ──────────────────────────────
@@ -199,9 +137,9 @@ class SecondScene(MatchScene):
         if len(self.clouds) >= CLOUD_MAX_ACTIVE:
             return
 
-        w_px = random.randint(CLOUD_MIN_W, CLOUD_MAX_W)
-        x_px = random.randint(CLOUD_MARGIN_X, SW - CLOUD_MARGIN_X - w_px)
-        y_px = random.randint(CLOUD_MIN_Y, CLOUD_MAX_Y)
+        w_px = self.rng.randint(CLOUD_MIN_W, CLOUD_MAX_W)
+        x_px = self.rng.randint(CLOUD_MARGIN_X, SW - CLOUD_MARGIN_X - w_px)
+        y_px = self.rng.randint(CLOUD_MIN_Y, CLOUD_MAX_Y)
 
         # Evitar solapamiento con nubes existentes
         new_rect = pygame.Rect(x_px, y_px, w_px, CLOUD_H)
@@ -211,14 +149,15 @@ class SecondScene(MatchScene):
 
         body = RocketFactory.create_cloud(
             self.world, x_px, y_px, w_px, CLOUD_H,
-            friction=CLOUD_FRICTION, restitution=CLOUD_RESTITUTION
+            friction=CLOUD_FRICTION, restitution=CLOUD_RESTITUTION,
+            pool=self.cloud_pool
         )
 
         self.clouds.append({'rect': new_rect, 'body': body, 'timer': 0})
 
     def _destroy_cloud_body(self, body):
-        """Elimina un cuerpo de nube del mundo Box2D."""
-        RocketFactory.destroy_body(self.world, body)
+        """Retira un cuerpo de nube del mundo Box2D (vuelve al pool)."""
+        RocketFactory.destroy_body(self.world, body, pool=self.cloud_pool)
 
     def _update_clouds(self, delta_time):
         """Spawn, envejecimiento y eliminación de nubes."""
@@ -445,91 +384,77 @@ class SecondScene(MatchScene):
 
     # ─── UPDATE ───────────────────────────────────────────────
 
-    def update(self, delta_time):
-        super().update(delta_time)
+    def _update_extras(self, step_ms):
+        with Profiler.section("update.hazards"):
+            self._update_cloud_hits()
 
-        hit_cloud_bodies = set()
-        if hasattr(self, 'contact_listener'):
-            hit_cloud_bodies = self.contact_listener.apply_pending_bounces()
+        with Profiler.section("update.ai"):
+            self._update_boss_ai(step_ms)
+        with Profiler.section("update.hazards"):
+            self._update_clouds(step_ms)
 
-        # Remove clouds that were hit
-        if hit_cloud_bodies:
+        if self.teleport_flash_timer > 0:
+            self.teleport_flash_timer = max(0, self.teleport_flash_timer - step_ms)
+
+        if self.kick_flash_timer > 0:
+            self.kick_flash_timer = max(0, self.kick_flash_timer - step_ms)
+
+    def _on_cloud_contact(self, ev):
+        """Impulso extra de rebote (normal: de la nube hacia el cuerpo)."""
+        nx, ny = ev.normal
+        ix = nx * CLOUD_BOUNCE_IMPULSE
+        iy = ny * CLOUD_BOUNCE_IMPULSE
+        if abs(ny) < 0.3:
+            iy = -abs(CLOUD_BOUNCE_IMPULSE) * 0.6
+
+        body = ev.body_b
+        body.ApplyLinearImpulse(impulse=(ix, iy), point=body.worldCenter, wake=True)
+        self._hit_clouds.add(ev.body_a)
+
+    def _update_cloud_hits(self):
+        """Elimina las nubes golpeadas desde el ultimo paso."""
+        if self._hit_clouds:
             alive = []
             for c in self.clouds:
-                if c['body'] in hit_cloud_bodies:
+                if c['body'] in self._hit_clouds:
                     self._destroy_cloud_body(c['body'])
                 else:
                     alive.append(c)
             self.clouds = alive
+            self._hit_clouds.clear()
 
-        self._update_boss_ai(delta_time)
-        self._update_clouds(delta_time)
+    # ─── RENDER ───────────────────────────────────────────────
 
-        if self.teleport_flash_timer > 0:
-            self.teleport_flash_timer = max(0, self.teleport_flash_timer - delta_time)
+    def _build_static_layers(self, layers):
+        layers.add(self._draw_stadium)
+        layers.add(self._draw_goals_bg)
 
-        if self.kick_flash_timer > 0:
-            self.kick_flash_timer = max(0, self.kick_flash_timer - delta_time)
+    def _draw_stadium(self, surface):
+        surface.blit(Assets.get_image("stadium2_bg"), (0, 0))
 
-    # ─── RENDER ───────────────────────────────────────────────
+    def _draw_goals_bg(self, surface):
+        size = (GOAL_W*2, GOAL_H)
+        surface.blit(Assets.get_image_variant("container_left_yellow_bg", size), (0, GOAL_TOP_Y))
+        surface.blit(Assets.get_image_variant("container_right_green_bg", size), (SW - GOAL_W*2, GOAL_TOP_Y))
 
     def _render_field(self, screen):
-        if not hasattr(self, '_stadium_bg'):
-            try:
-                bg = pygame.image.load('./assets/stadiums/stadium2_bg.png').convert()
-                self._stadium_bg = pygame.transform.scale(bg, (SW, SH))
-            except Exception:
-                self._stadium_bg = pygame.Surface((SW, SH))
-                self._stadium_bg.fill(BG_COLOR)
-        screen.blit(self._stadium_bg, (0, 0))
-
-        if not hasattr(self, '_goalpost_bg'):
-            try:
-                l_yellow_container_bg    = pygame.image.load('./assets/stadiums/contenedor_left_yellow_bg.png').convert_alpha()
-                r_green_container_bg    = pygame.image.load('./assets/stadiums/contenedor_right_green_bg.png').convert_alpha()
-
-                l_yellow_container_bg_scaled = pygame.transform.scale(l_yellow_container_bg, (GOAL_W*2, GOAL_H))
-                r_green_container_bg_scaled = pygame.transform.scale(r_green_container_bg, (GOAL_W*2, GOAL_H))
-                
-                self._goalpost_bg_l = l_yellow_container_bg_scaled
-                self._goalpost_bg_r = r_green_container_bg_scaled
-            except Exception:
-                self._goalpost_bg_l = pygame.Surface((GOAL_W, GOAL_H), pygame.SRCALPHA)
-                pygame.draw.rect(self._goalpost_bg_l, (*GOAL_NET_COLOR,), (0, 0, GOAL_W, GOAL_H))
-                self._goalpost_bg_r = self._goalpost_bg_l.copy()
-            self._goalpost_bg = True
-
-        screen.blit(self._goalpost_bg_l, (0, GOAL_TOP_Y))
-        screen.blit(self._goalpost_bg_r, (SW - GOAL_W*2, GOAL_TOP_Y))
-
+        self.static_layers.blit(screen)
         self._draw_clouds(screen)
 
     def _render_field_fg(self, screen):
-        if not hasattr(self, '_goalpost_fg'):
-            try:
-                l_yellow_container_fg    = pygame.image.load('./assets/stadiums/contenedor_left_yellow_fg.png').convert_alpha()
-                r_green_container_fg    = pygame.image.load('./assets/stadiums/contenedor_right_green_fg.png').convert_alpha()
-
-                l_yellow_container_fg_scaled = pygame.transform.scale(l_yellow_container_fg, (GOAL_W*2, GOAL_H))
-                r_green_container_fg_scaled = pygame.transform.scale(r_green_container_fg , (GOAL_W*2, GOAL_H))
-
-                self._goalpost_fg_l = l_yellow_container_fg_scaled
-                self._goalpost_fg_r = r_green_container_fg_scaled
-            except Exception:
-                self._goalpost_fg_l = pygame.Surface((GOAL_W*2, GOAL_H), pygame.SRCALPHA)
-                self._goalpost_fg_r = self._goalpost_fg_l.copy()
-            self._goalpost_fg = True
-
-        screen.blit(self._goalpost_fg_l, (0, GOAL_TOP_Y))
-        screen.blit(self._goalpost_fg_r, (SW - GOAL_W*2, GOAL_TOP_Y))
+        size = (GOAL_W*2, GOAL_H)
+        screen.blit(Assets.get_image_variant("container_left_yellow_fg", size), (0, GOAL_TOP_Y))
+        screen.blit(Assets.get_image_variant("container_right_green_fg", size), (SW - GOAL_W*2, GOAL_TOP_Y))
 
     def render(self, screen):
         super().render(screen)
         if not self.is_exiting:
-            self._draw_angry_indicator(screen)
-            self._draw_teleport_flash(screen)
-            self._draw_kick_flash(screen)
-            self._draw_kick_hud(screen)
+            with Profiler.section("render.hud"):
+                self._draw_angry_indicator(screen)
+                self._draw_kick_hud(screen)
+            with Profiler.section("render.overlays"):
+                self._draw_teleport_flash(screen)
+                self._draw_kick_flash(screen)
 
     # ─── DIBUJO DE NUBES ─────────────────────────────────────
 
@@ -563,7 +488,7 @@ class SecondScene(MatchScene):
                 pygame.draw.circle(cloud_surf, (*CLOUD_COLOR, bulge_alpha), (bx, by), 15)
 
             if alpha > 100:
-                warn_font = pygame.font.SysFont('Arial', 14, bold=True)
+                warn_font = Assets.get_font('Arial', 14, bold=True)
                 warn_text = warn_font.render("⚡", True, (255, 255, 255, alpha))
                 cloud_surf.blit(warn_text, warn_text.get_rect(
                     center=(rect.width // 2, rect.height // 2)))
@@ -581,11 +506,11 @@ class SecondScene(MatchScene):
             color = ANGRY_INDICATOR_COLOR if blink else (200, 60, 30)
             tp_tag = " [TP USADO]" if self._teleport_used_this_anger else " [TP LISTO]"
             label  = "⚠ MOTOMOTO ENFADADO!" + tp_tag
-            text   = self.angry_font.render(label, True, color)
+            text   = TextCache.render(self.angry_font, label, True, color)
         else:
             remaining_s = max(0, (30000 - self.boss.angry_timer) / 1000)
             label = f"MotoMoto: calmado  ({remaining_s:.0f}s)"
-            text  = self.angry_font.render(label, True, (150, 255, 150))
+            text  = TextCache.render(self.angry_font, label, True, (150, 255, 150))
 
         rect = text.get_rect(topright=ANGRY_INDICATOR_POS)
         bg   = pygame.Surface((rect.width + 16, rect.height + 8), pygame.SRCALPHA)
@@ -632,7 +557,7 @@ class SecondScene(MatchScene):
         screen.blit(flash_surf, (cx - radius, cy - radius))
 
         if ratio > 0.5:
-            kick_text = self.kick_font.render("💥 KICK!", True, POWERUP_KICK_COLOR)
+            kick_text = TextCache.render(self.kick_font, "💥 KICK!", True, POWERUP_KICK_COLOR)
             screen.blit(kick_text, kick_text.get_rect(center=(cx, cy - 30)))
 
         t = pygame.time.get_ticks() / 100.0
@@ -664,7 +589,7 @@ class SecondScene(MatchScene):
                 color = (255, 200, 0)
                 label = f"⚡ PELOTAZO [E] - Acércate ({dist:.1f}m)"
 
-            text = self.kick_font.render(label, True, color)
+            text = TextCache.render(self.kick_font, label, True, color)
             rect = text.get_rect(topleft=(10, 40))
             bg   = pygame.Surface((rect.width + 8, rect.height + 4), pygame.SRCALPHA)
             bg.fill((0, 0, 0, 150))
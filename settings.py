@@ -26,6 +26,31 @@ class GameSettings:
     
     MATCH_DURATION = 180 # in seconds
 
+class PhysicsSettings:
+
+    TIME_STEP = 1.0 / 60.0  # paso fijo de Box2D en segundos
+    MAX_SUBSTEPS = 5        # maximo de pasos por frame (evita la espiral de la muerte)
+    VELOCITY_ITERATIONS = 8
+    POSITION_ITERATIONS = 3
+    # Modo determinista: cada frame avanza exactamente un paso de fisica
+    # (ignora el delta_time real) y la semilla de la partida es fija
+    DETERMINISTIC = os.environ.get("ROCKET_DETERMINISTIC") == "1"
+    MATCH_SEED = int(os.environ["ROCKET_SEED"]) if os.environ.get("ROCKET_SEED") else None
+
+class ReplaySettings:
+
+    # Cada partido graba su input (replay.py) y lo guarda al terminar
+    RECORD = os.environ.get("ROCKET_REPLAY", "1") == "1"
+    DIRECTORY = "replays"
+    KEEP = 20  # replays que se conservan; los mas antiguos se borran
+
+class AssetSettings:
+
+    IMAGE_CACHE_BUDGET_MB = 256  # imagenes decodificadas residentes
+    SOUND_CACHE_BUDGET_MB = 64   # sonidos (PCM) residentes
+    RAW_CACHE_ENABLED = True     # pixeles ya convertidos/escalados en assets/cache
+    RAW_CACHE_MIN_PIXELS = 256 * 256  # las imagenes pequenas se decodifican igual de rapido
+
 class DialogueAnimationController:
     POP   = "pop"
     SLIDE = "slide"
@@ -25,6 +25,8 @@ DIALOGUE_SPEED_Y = 340
 DIALOGUE_ANIM_Y = 400
 SLIDER_LABEL_OFFSET = 40
 SAVE_BUTTON_Y = 490
+SAVE_MESSAGE_Y = SAVE_BUTTON_Y + 60
+ROW_HEIGHT = 60  # franja que se redibuja al cambiar una fila
 
 class VolumeSlider:
 
@@ -165,6 +167,7 @@ class SettingsScene(PyGameScene):
 
     def __init__(self, director):
         super().__init__(director)
+        self.uses_dirty_rects = True
         
         # --- Background Image ---
         try:
@@ -178,8 +181,8 @@ class SettingsScene(PyGameScene):
             self.background_image = None
         # ---------------------------------------------
 
-        self.title_font = pygame.font.SysFont(GUISettings.FONT_TEXT, TITLE_FONT_SIZE, bold=True)
-        self.label_font = pygame.font.SysFont(GUISettings.FONT_TEXT, LABEL_FONT_SIZE)
+        self.title_font = Assets.get_font(GUISettings.FONT_TEXT, TITLE_FONT_SIZE, bold=True)
+        self.label_font = Assets.get_font(GUISettings.FONT_TEXT, LABEL_FONT_SIZE)
         slider_x = ScreenSettings.SCREEN_WIDTH // 2 - 150
 
         # Load saved settings
@@ -228,6 +231,16 @@ class SettingsScene(PyGameScene):
         elif self.selected_index == 4:
             self.save_button.hover = True
 
+    def _row_rect(self, y):
+        return pygame.Rect(0, y - ROW_HEIGHT // 2, ScreenSettings.SCREEN_WIDTH, ROW_HEIGHT)
+
+    def _mark_element_dirty(self, index):
+        if index == 4:
+            self.mark_dirty(self.save_button.base_rect.inflate(4, 4))
+        else:
+            ys = (MUSIC_SLIDER_Y, SFX_SLIDER_Y, DIALOGUE_SPEED_Y, DIALOGUE_ANIM_Y)
+            self.mark_dirty(self._row_rect(ys[index]))
+
     def update(self, delta_time):
         VolumeController.set_music_volume(self.music_slider.get_value())
         VolumeController.set_sfx_volume(self.sfx_slider.get_value())
@@ -237,6 +250,7 @@ class SettingsScene(PyGameScene):
             if self.save_message_timer >= 2000:
                 self.show_save_message = False
                 self.save_message_timer = 0
+                self.mark_dirty(self._row_rect(SAVE_MESSAGE_Y))
 
     def events(self, event_list):
         for event in event_list:
@@ -244,15 +258,20 @@ class SettingsScene(PyGameScene):
                 if event.key == K_ESCAPE:
                     self.director.exitScene()
                 elif event.key == K_UP:
+                    self._mark_element_dirty(self.selected_index)
                     self.selected_index = (self.selected_index - 1) % len(self.elements)
                     self._update_selection()
+                    self._mark_element_dirty(self.selected_index)
                 elif event.key == K_DOWN:
+                    self._mark_element_dirty(self.selected_index)
                     self.selected_index = (self.selected_index + 1) % len(self.elements)
                     self._update_selection()
+                    self._mark_element_dirty(self.selected_index)
                 elif event.key == K_RETURN or event.key == K_KP_ENTER:
                     if self.selected_index == 4:  # Save button
                         self.save_button.action()
                 elif event.key == K_LEFT or event.key == K_RIGHT:
+                    self._mark_element_dirty(self.selected_index)
                     if self.selected_index == 0:
                         self.music_slider.handle_event(event)
                         # Aplicar cambio inmediatamente
@@ -332,7 +351,7 @@ class SettingsScene(PyGameScene):
     def _render_save_confirmation(self, screen):
         save_msg = self.label_font.render("Settings Saved!", True, (100, 255, 100))
         save_msg_rect = save_msg.get_rect(
-            center=(ScreenSettings.SCREEN_WIDTH // 2, SAVE_BUTTON_Y + 60)
+            center=(ScreenSettings.SCREEN_WIDTH // 2, SAVE_MESSAGE_Y)
         )
         screen.blit(save_msg, save_msg_rect)
 
@@ -354,3 +373,4 @@ class SettingsScene(PyGameScene):
 
         self.show_save_message = True
         self.save_message_timer = 0
+        self.mark_dirty(self._row_rect(SAVE_MESSAGE_Y))
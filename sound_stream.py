@@ -0,0 +1,81 @@
+import pygame
+
+STREAM_CHUNK_MS = 500  # duracion de cada trozo encolado en el canal
+STREAM_CHANNELS = 2    # canales reservados para streams (los efectos no los roban)
+
+
+class SoundStream:
+    """Reproduce un sonido largo por trozos en lugar de tenerlo entero en
+    memoria como pygame.mixer.Sound.
+
+    Lee PCM crudo (en el formato del mixer) de un fichero en disco y encola
+    trozos de STREAM_CHUNK_MS en un canal reservado; en memoria solo viven el
+    trozo que suena y el encolado. update() debe llamarse cada frame para
+    mantener la cola llena (el Director lo hace via Assets.update_streams).
+    """
+
+    _next_channel = 0
+
+    def __init__(self, pcm_path):
+        self.pcm_path = pcm_path
+        freq, size, channels = pygame.mixer.get_init()
+        frame_bytes = abs(size) // 8 * channels
+        self._chunk_bytes = int(freq * STREAM_CHUNK_MS / 1000) * frame_bytes
+        self._file = None
+        self.loops = 0
+        self.channel = self._reserve_channel()
+
+    @classmethod
+    def _reserve_channel(cls):
+        if pygame.mixer.get_num_channels() <= STREAM_CHANNELS:
+            pygame.mixer.set_num_channels(STREAM_CHANNELS + 8)
+        pygame.mixer.set_reserved(STREAM_CHANNELS)
+        channel = pygame.mixer.Channel(cls._next_channel % STREAM_CHANNELS)
+        cls._next_channel += 1
+        return channel
+
+    @property
+    def playing(self):
+        return self._file is not None
+
+    def play(self, loops=-1, volume=1.0):
+        """loops=-1 repite indefinidamente, 0 suena una vez."""
+        self.stop()
+        self._file = open(self.pcm_path, "rb")
+        self.loops = loops
+        self.channel.set_volume(volume)
+        first = self._next_chunk()
+        if first is None:
+            self.stop()
+            return
+        self.channel.play(first)
+        self.update()
+
+    def set_volume(self, volume):
+        self.channel.set_volume(volume)
+
+    def stop(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.channel.stop()
+
+    def _next_chunk(self):
+        data = self._file.read(self._chunk_bytes)
+        if len(data) < self._chunk_bytes and self.loops != 0:
+            if self.loops > 0:
+                self.loops -= 1
+            self._file.seek(0)
+            data += self._file.read(self._chunk_bytes - len(data))
+        if not data:
+            return None
+        return pygame.mixer.Sound(buffer=data)
+
+    def update(self):
+        if self._file is None or self.channel.get_queue() is not None:
+            return
+        chunk = self._next_chunk()
+        if chunk is not None:
+            self.channel.queue(chunk)
+        elif not self.channel.get_busy():
+            self.stop()
@@ -0,0 +1,45 @@
+import pygame
+
+
+class StaticLayers:
+    """Composicion cacheada de las capas estaticas de un escenario.
+
+    Cada capa es una funcion draw(surface) que pinta sobre la superficie
+    compuesta, en el orden en que se anadieron. Invalidar rehace la
+    composicion entera (todas las capas son blits de imagenes ya cargadas,
+    asi que rehacer solo una no ahorraria nada); el resto de frames cuesta
+    un unico blit a pantalla completa.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._layers = []      # [draw_fn]
+        self._surface = None
+        self._dirty = True
+
+    def add(self, draw_fn):
+        self._layers.append(draw_fn)
+        self._dirty = True
+
+    def invalidate(self):
+        """Marca la composicion para rehacerse en el proximo blit (p. ej.
+        cuando aparece o desaparece una trampilla)."""
+        self._dirty = True
+
+    def _bake(self):
+        if self._surface is None:
+            self._surface = pygame.Surface(self.size)
+            if pygame.display.get_surface():
+                self._surface = self._surface.convert()
+        self._surface.fill((0, 0, 0))
+        for draw_fn in self._layers:
+            draw_fn(self._surface)
+        self._dirty = False
+
+    def get(self):
+        if self._dirty:
+            self._bake()
+        return self._surface
+
+    def blit(self, screen):
+        screen.blit(self.get(), (0, 0))
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """Cache LRU de superficies de texto ya rasterizadas.
+
+    La clave es (fuente, texto, color, antialias): el marcador, el reloj y
+    los indicadores de los bosses solo cambian unas pocas veces por segundo,
+    asi que casi todos los frames se sirven sin llamar a font.render.
+    Las superficies devueltas son compartidas y no deben modificarse.
+    """
+
+    MAX_ENTRIES = 256
+
+    _cache = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def render(cls, font, text, antialias, color):
+        """Equivalente a font.render(text, antialias, color), pero cacheado."""
+        key = (font, text, tuple(color), antialias)
+        surface = cls._cache.get(key)
+        if surface is not None:
+            cls._cache.move_to_end(key)
+            cls.hits += 1
+            return surface
+
+        cls.misses += 1
+        surface = font.render(text, antialias, color)
+        cls._cache[key] = surface
+        if len(cls._cache) > cls.MAX_ENTRIES:
+            cls._cache.popitem(last=False)
+        return surface
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def stats(cls):
+        return {'entries': len(cls._cache), 'hits': cls.hits, 'misses': cls.misses}
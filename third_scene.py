@@ -1,9 +1,12 @@
 import pygame
 import math
-import random
 import Box2D
 from match_scene import MatchScene, px2m, m2px, SW, SH, PPM
-from factory import RocketFactory
+from factory import RocketFactory, BodyPool
+from contact_dispatcher import CAT_TRAPDOOR, CAT_PLAYER
+from profiler import Profiler
+from text_cache import TextCache
+from assets_manager import Assets
 
 
 GROUND_Y   = 570
@@ -55,67 +58,6 @@ TRAPDOOR_X_MAX = SW - GOAL_W - 40
 TRAPDOOR_MIN_SEPARATION = 120  # px mínimo entre centros de trampillas
 
 
-class ThirdSceneContactListener(Box2D.b2ContactListener):
-    """Listener for ThirdScene: adds player-trapdoor contact detection."""
-
-    def __init__(self, scene):
-        super().__init__()
-        self.scene = scene
-        self._trapdoor_contact_count = {}
-
-    def reset_flags(self):
-        self._trapdoor_contact_count = {}
-
-    def clear_trapdoor_contacts(self, trapdoor_idx):
-        keys_to_remove = [key for key in self._trapdoor_contact_count if key[0] == trapdoor_idx]
-        for key in keys_to_remove:
-            self._trapdoor_contact_count.pop(key, None)
-
-    def _get_trapdoor_player_pair(self, contact):
-        fixture_a = contact.fixtureA
-        fixture_b = contact.fixtureB
-        data_a = fixture_a.userData
-        data_b = fixture_b.userData
-
-        player_body = self.scene.jugador.body if hasattr(self.scene, 'jugador') else None
-        if player_body is None:
-            return None, None
-
-        if isinstance(data_a, dict) and data_a.get('type') == 'trapdoor' and fixture_b.body is player_body:
-            return data_a.get('index'), player_body
-        if isinstance(data_b, dict) and data_b.get('type') == 'trapdoor' and fixture_a.body is player_body:
-            return data_b.get('index'), player_body
-        return None, None
-
-    def BeginContact(self, contact):
-        trapdoor_idx, player_body = self._get_trapdoor_player_pair(contact)
-        if trapdoor_idx is None or player_body is None:
-            return
-
-        key = (trapdoor_idx, id(player_body))
-        count = self._trapdoor_contact_count.get(key, 0) + 1
-        self._trapdoor_contact_count[key] = count
-
-        if count == 1:
-            td = self.scene._get_trapdoor_by_index(trapdoor_idx)
-            if td is not None:
-                td['player_inside'] = True
-
-    def EndContact(self, contact):
-        trapdoor_idx, player_body = self._get_trapdoor_player_pair(contact)
-        if trapdoor_idx is None or player_body is None:
-            return
-
-        key = (trapdoor_idx, id(player_body))
-        count = self._trapdoor_contact_count.get(key, 0) - 1
-        if count <= 0:
-            self._trapdoor_contact_count.pop(key, None)
-            td = self.scene._get_trapdoor_by_index(trapdoor_idx)
-            if td is not None:
-                td['player_inside'] = False
-        else:
-            self._trapdoor_contact_count[key] = count
-
 class ThirdScene(MatchScene):
     """
     Scene: La Jenny.
@@ -126,6 +68,9 @@ class ThirdScene(MatchScene):
         - Power-up: Sunglasses: protect from the flash while active.
     """
 
+    asset_keys = ("player_car", "ball", "jenny_car", "stadium3_bg",
+                  "stadium3_goalpost_bg", "stadium3_goalpost_fg")
+
     def _get_config(self):
         return {
             'ground_y':      GROUND_Y,
@@ -136,14 +81,15 @@ class ThirdScene(MatchScene):
             'player_jump':   -28.0,
             'ground_blend':  0.35,
             'air_blend':     0.12,
-            'player_hh':     3.5,
             'goal_pause_ms': 2000,
             'music_name': "match3_bg_playing_theme"
         }
 
     def _init_extras(self):
-        self.contact_listener = ThirdSceneContactListener(self)
-        self.world.contactListener = self.contact_listener
+        # Jugador sobre trampillas: sensor b2Body -> nº de contactos
+        self._trapdoor_contacts = {}
+        self.contact_listener.on(CAT_TRAPDOOR, CAT_PLAYER,
+                                 begin=self._on_trapdoor_begin, end=self._on_trapdoor_end)
 
         # Boss Jenny
         self.boss = RocketFactory.create_element(
@@ -153,8 +99,9 @@ class ThirdScene(MatchScene):
         # Flash
         self.player_flashed = False
         self.flash_stun_timer = 0
-        self.flash_font = pygame.font.SysFont('Arial', FLASH_FONT_SIZE, bold=True)
-        self.jenny_font = pygame.font.SysFont('Arial', 18, bold=True)
+        self.flash_font = Assets.get_font('Arial', FLASH_FONT_SIZE, bold=True)
+        self.jenny_font = Assets.get_font('Arial', 18, bold=True)
+        self.sunglasses_font = Assets.get_font('Arial', 16, bold=True)
         self._flash_overlay_alpha = 0
         self._flash_hold_timer = 0
         self._flash_protected_timer = 0
@@ -162,20 +109,39 @@ class ThirdScene(MatchScene):
 
         # Trapdoors: lista dinámica + contador de índices únicos
         self._trapdoors = []
+        self._trapdoor_pool = BodyPool(self.world, TRAPDOOR_MAX_VISIBLE)
         self._next_trapdoor_index = 0
-        self._spawn_timer = random.randint(*TRAPDOOR_SPAWN_INTERVAL_RANGE)
+        self._spawn_timer = self.rng.randint(*TRAPDOOR_SPAWN_INTERVAL_RANGE)
 
-    def _get_trapdoor_by_index(self, index):
-        """Busca una trampilla por su índice único."""
+    def _get_trapdoor_by_body(self, body):
+        """Busca una trampilla por su sensor Box2D."""
         for td in self._trapdoors:
-            if td['index'] == index:
+            if td['sensor_body'] == body:
                 return td
         return None
 
+    def _on_trapdoor_begin(self, ev):
+        count = self._trapdoor_contacts.get(ev.body_a, 0) + 1
+        self._trapdoor_contacts[ev.body_a] = count
+        if count == 1:
+            td = self._get_trapdoor_by_body(ev.body_a)
+            if td is not None:
+                td['player_inside'] = True
+
+    def _on_trapdoor_end(self, ev):
+        count = self._trapdoor_contacts.get(ev.body_a, 0) - 1
+        if count > 0:
+            self._trapdoor_contacts[ev.body_a] = count
+            return
+        self._trapdoor_contacts.pop(ev.body_a, None)
+        td = self._get_trapdoor_by_body(ev.body_a)
+        if td is not None:
+            td['player_inside'] = False
+
     def _random_x_center(self):
         """Genera una posición X aleatoria para una trampilla, respetando separación mínima."""
         for _ in range(30):
-            cx = random.randint(TRAPDOOR_X_MIN, TRAPDOOR_X_MAX)
+            cx = self.rng.randint(TRAPDOOR_X_MIN, TRAPDOOR_X_MAX)
             too_close = False
             for td in self._trapdoors:
                 if abs(td['rect'].centerx - cx) < TRAPDOOR_MIN_SEPARATION:
@@ -199,7 +165,7 @@ class ThirdScene(MatchScene):
         rect = pygame.Rect(x_px, y_px, TRAPDOOR_W, TRAPDOOR_H)
 
         sensor_body = RocketFactory.create_trapdoor_sensor(
-            self.world, cx_px, y_px, TRAPDOOR_W, TRAPDOOR_H, idx
+            self.world, cx_px, y_px, TRAPDOOR_W, TRAPDOOR_H, pool=self._trapdoor_pool
         )
 
         self._trapdoors.append({
@@ -209,26 +175,28 @@ class ThirdScene(MatchScene):
             'player_inside': False,
             'active': False,
             'active_timer': 0,
-            'lifetime': random.randint(*TRAPDOOR_VISIBLE_MS_RANGE),
+            'lifetime': self.rng.randint(*TRAPDOOR_VISIBLE_MS_RANGE),
         })
+        self.static_layers.invalidate()
 
     def _despawn_trapdoor(self, td):
         """Elimina una trampilla y destruye su body."""
         body = td.get('sensor_body')
         if body:
-            RocketFactory.destroy_body(self.world, body)
+            self._trapdoor_contacts.pop(body, None)
+            RocketFactory.destroy_body(self.world, body, pool=self._trapdoor_pool)
             td['sensor_body'] = None
-        if hasattr(self, 'contact_listener'):
-            self.contact_listener.clear_trapdoor_contacts(td['index'])
         self._trapdoors.remove(td)
+        self.static_layers.invalidate()
 
     def _destroy_trapdoors(self):
         for td in list(self._trapdoors):
             body = td.get('sensor_body')
             if body:
-                RocketFactory.destroy_body(self.world, body)
+                RocketFactory.destroy_body(self.world, body, pool=self._trapdoor_pool)
                 td['sensor_body'] = None
         self._trapdoors = []
+        self.static_layers.invalidate()
 
     def _update_trapdoors(self, delta_time):
         player_body = self.jugador.body
@@ -244,7 +212,7 @@ class ThirdScene(MatchScene):
         # Intentar spawnear nuevas trampillas
         self._spawn_timer -= delta_time
         if self._spawn_timer <= 0:
-            self._spawn_timer = random.randint(*TRAPDOOR_SPAWN_INTERVAL_RANGE)
+            self._spawn_timer = self.rng.randint(*TRAPDOOR_SPAWN_INTERVAL_RANGE)
             if len(self._trapdoors) < TRAPDOOR_MAX_VISIBLE:
                 self._spawn_trapdoor()
 
@@ -255,6 +223,7 @@ class ThirdScene(MatchScene):
                 td['active_timer'] -= delta_time
                 if td['active_timer'] <= 0:
                     td['active'] = False
+                    self.static_layers.invalidate()
                 continue
 
             rect = td['rect']
@@ -277,6 +246,7 @@ class ThirdScene(MatchScene):
             if launched:
                 td['active'] = True
                 td['active_timer'] = TRAPDOOR_ACTIVE_MS
+                self.static_layers.invalidate()
 
     def _launch_player_up(self, body):
         vel = body.linearVelocity
@@ -360,15 +330,8 @@ class ThirdScene(MatchScene):
     def _on_powerup_activate(self):
         pass
 
-    def events(self, event_list):
-        if self.player_flashed:
-            from pygame.locals import KEYDOWN, K_ESCAPE
-            from ingame_menu_scene import IngameMenu
-            for ev in event_list:
-                if ev.type == KEYDOWN and ev.key == K_ESCAPE:
-                    self.director.apilarEscena(IngameMenu(self.director))
-            return
-        super().events(event_list)
+    def _input_locked(self):
+        return self.player_flashed
 
     # ─── BOUNDARIES & GOALS (delegado a RocketFactory) ───────
 
@@ -485,93 +448,72 @@ class ThirdScene(MatchScene):
         self._sunglasses_timer = 0
         self.player_has_powerup = False
 
-        if hasattr(self, 'contact_listener') and hasattr(self.contact_listener, 'reset_flags'):
-            self.contact_listener.reset_flags()
+        self._trapdoor_contacts.clear()
 
         # Destruir trampillas existentes y reiniciar
         self._destroy_trapdoors()
         self._next_trapdoor_index = 0
-        self._spawn_timer = random.randint(*TRAPDOOR_SPAWN_INTERVAL_RANGE)
-
-    def update(self, delta_time):
-        super().update(delta_time)
-
-        self._update_jenny_ai(delta_time)
-        self._update_trapdoors(delta_time)
-        self._update_flash_stun(delta_time)
-
-    def _render_field(self, screen):
-        try:
-            if not hasattr(self, '_stadium_bg'):
-                bg = pygame.image.load('./assets/stadiums/stadium3_bg.png').convert()
-                self._stadium_bg = pygame.transform.scale(bg, (SW, SH))
-            screen.blit(self._stadium_bg, (0, 0))
-        except Exception:
-            screen.fill((20, 80, 40))
-
-        # Trapdoors
+        self._spawn_timer = self.rng.randint(*TRAPDOOR_SPAWN_INTERVAL_RANGE)
+
+    def _update_extras(self, step_ms):
+        with Profiler.section("update.ai"):
+            self._update_jenny_ai(step_ms)
+        with Profiler.section("update.hazards"):
+            self._update_trapdoors(step_ms)
+        self._update_flash_stun(step_ms)
+
+    def _build_static_layers(self, layers):
+        # Las trampillas se hornean en la composicion y se invalidan al
+        # aparecer, desaparecer o activarse.
+        layers.add(self._draw_stadium)
+        layers.add(self._draw_trapdoors)
+        layers.add(self._draw_goals_bg)
+
+    def _draw_stadium(self, surface):
+        surface.blit(Assets.get_image("stadium3_bg"), (0, 0))
+
+    def _draw_trapdoors(self, surface):
         for td in self._trapdoors:
             color = TRAPDOOR_ACTIVE_COLOR if td['active'] else TRAPDOOR_COLOR
-            pygame.draw.rect(screen, color, td['rect'])
-            pygame.draw.rect(screen, TRAPDOOR_BORDER_COLOR, td['rect'], 2)
+            pygame.draw.rect(surface, color, td['rect'])
+            pygame.draw.rect(surface, TRAPDOOR_BORDER_COLOR, td['rect'], 2)
             mx = td['rect'].centerx
             y0 = td['rect'].top + 2
             y1 = td['rect'].bottom - 2
-            pygame.draw.line(screen, TRAPDOOR_BORDER_COLOR, (mx - 15, y0), (mx - 15, y1), 1)
-            pygame.draw.line(screen, TRAPDOOR_BORDER_COLOR, (mx + 15, y0), (mx + 15, y1), 1)
-            pygame.draw.rect(screen, (120, 120, 160),
+            pygame.draw.line(surface, TRAPDOOR_BORDER_COLOR, (mx - 15, y0), (mx - 15, y1), 1)
+            pygame.draw.line(surface, TRAPDOOR_BORDER_COLOR, (mx + 15, y0), (mx + 15, y1), 1)
+            pygame.draw.rect(surface, (120, 120, 160),
                              pygame.Rect(mx - 4, td['rect'].centery - 2, 8, 4))
-        
-        # Porterías fondo
-        if not hasattr(self, '_goalpost_bg'):
-            try:
-                l_goalpost_bg    = pygame.image.load('./assets/stadiums/stadium-3-goalpost-bg.png').convert_alpha()
-                r_goalpost_bg    = pygame.image.load('./assets/stadiums/stadium-3-goalpost-bg.png').convert_alpha()
-
-                l_goalpost_bg_scaled = pygame.transform.scale(l_goalpost_bg, (GOAL_W*2, GOAL_H))
-                r_goalpost_bg_scaled = pygame.transform.flip(l_goalpost_bg_scaled, True, False)
-                
-                self._goalpost_bg_l = l_goalpost_bg_scaled
-                self._goalpost_bg_r = r_goalpost_bg_scaled
-            except Exception:
-                self._goalpost_bg_l = pygame.Surface((GOAL_W, GOAL_H), pygame.SRCALPHA)
-                pygame.draw.rect(self._goalpost_bg_l, (*GOAL_NET_COLOR,), (0, 0, GOAL_W, GOAL_H))
-                self._goalpost_bg_r = self._goalpost_bg_l.copy()
-            self._goalpost_bg = True
-
-        screen.blit(self._goalpost_bg_l, (L_GOAL_POS, GOAL_TOP_Y))
-        screen.blit(self._goalpost_bg_r, (SW - GOAL_W+L_GOAL_POS+50, GOAL_TOP_Y))
 
-    def _render_field_fg(self, screen):
-        if not hasattr(self, '_goalpost_fg'):
-            try:
-                l_goalpost_fg    = pygame.image.load('./assets/stadiums/stadium-3-goalpost-fg.png').convert_alpha()
+    def _draw_goals_bg(self, surface):
+        size = (GOAL_W*2, GOAL_H)
+        surface.blit(Assets.get_image_variant("stadium3_goalpost_bg", size), (L_GOAL_POS, GOAL_TOP_Y))
+        surface.blit(Assets.get_image_variant("stadium3_goalpost_bg", size, flip_x=True),
+                     (SW - GOAL_W+L_GOAL_POS+50, GOAL_TOP_Y))
 
-                l_goalpost_fg_scaled = pygame.transform.scale(l_goalpost_fg, (GOAL_W*2, GOAL_H))
-                r_goalpost_fg_scaled = pygame.transform.flip(l_goalpost_fg_scaled, True, False)
-
-                self._goalpost_fg_l = l_goalpost_fg_scaled
-                self._goalpost_fg_r = r_goalpost_fg_scaled
-            except Exception:
-                self._goalpost_fg_l = pygame.Surface((GOAL_W, GOAL_H), pygame.SRCALPHA)
-                self._goalpost_fg_r = self._goalpost_fg_l.copy()
-            self._goalpost_fg = True
+    def _render_field(self, screen):
+        self.static_layers.blit(screen)
 
-        screen.blit(self._goalpost_fg_l, (L_GOAL_POS, GOAL_TOP_Y))
-        screen.blit(self._goalpost_fg_r, (SW - GOAL_W-50, GOAL_TOP_Y))
+    def _render_field_fg(self, screen):
+        size = (GOAL_W*2, GOAL_H)
+        screen.blit(Assets.get_image_variant("stadium3_goalpost_fg", size), (L_GOAL_POS, GOAL_TOP_Y))
+        screen.blit(Assets.get_image_variant("stadium3_goalpost_fg", size, flip_x=True),
+                    (SW - GOAL_W-50, GOAL_TOP_Y))
 
     def render(self, screen):
         super().render(screen)
-        if self._flash_overlay_alpha > 0:
-            self._draw_flash_overlay(screen)
+        with Profiler.section("render.overlays"):
+            if self._flash_overlay_alpha > 0:
+                self._draw_flash_overlay(screen)
 
-        if self.player_flashed:
-            self._draw_blind_indicator(screen)
-        elif hasattr(self, '_flash_protected_timer') and self._flash_protected_timer > 0:
-            self._draw_protected_indicator(screen)
+            if self.player_flashed:
+                self._draw_blind_indicator(screen)
+            elif hasattr(self, '_flash_protected_timer') and self._flash_protected_timer > 0:
+                self._draw_protected_indicator(screen)
 
         if not self.is_exiting:
-            self._draw_jenny_indicator(screen)
+            with Profiler.section("render.hud"):
+                self._draw_jenny_indicator(screen)
 
     def _render_powerup_hud(self, screen):
         if self.player_has_powerup:
@@ -581,7 +523,7 @@ class ThirdScene(MatchScene):
                 color = (255, 80, 80)
             else:
                 color = SUNGLASSES_HUD_COLOR
-            text = pygame.font.SysFont('Arial', 16, bold=True).render(label, True, color)
+            text = TextCache.render(self.sunglasses_font, label, True, color)
             rect = text.get_rect(bottomleft=(10, 30))
             bg = pygame.Surface((rect.width + 12, rect.height + 8), pygame.SRCALPHA)
             bg.fill((0, 0, 0, 160))
@@ -609,9 +551,9 @@ class ThirdScene(MatchScene):
             px = int(m2px(self.jugador.body.position.x))
             py = int(m2px(self.jugador.body.position.y)) - 45
 
-            text = self.flash_font.render("¡CEGADO!", True, FLASH_STUN_TXT_COLOR)
+            text = TextCache.render(self.flash_font, "¡CEGADO!", True, FLASH_STUN_TXT_COLOR)
             rect = text.get_rect(center=(px, py))
-            shadow = self.flash_font.render("¡CEGADO!", True, (80, 60, 0))
+            shadow = TextCache.render(self.flash_font, "¡CEGADO!", True, (80, 60, 0))
             screen.blit(shadow, shadow.get_rect(center=(px + 2, py + 2)))
             screen.blit(text, rect)
 
@@ -634,7 +576,7 @@ class ThirdScene(MatchScene):
     def _draw_protected_indicator(self, screen):
         blink = (pygame.time.get_ticks() // 220) % 2 == 0
         if blink:
-            text = self.flash_font.render("¡FLASH BLOQUEADO!", True, SUNGLASSES_COLOR)
+            text = TextCache.render(self.flash_font, "¡FLASH BLOQUEADO!", True, SUNGLASSES_COLOR)
             rect = text.get_rect(center=(SW // 2, SH // 2 - 60))
             bg = pygame.Surface((rect.width + 16, rect.height + 8), pygame.SRCALPHA)
             bg.fill((0, 0, 0, 150))
@@ -648,9 +590,9 @@ class ThirdScene(MatchScene):
         if getattr(self.boss, 'is_flashing', False):
             blink = (pygame.time.get_ticks() // 120) % 2 == 0
             color = (255, 255, 100) if blink else (200, 180, 0)
-            text = self.jenny_font.render("⚡ JENNY: ¡FLASH!", True, color)
+            text = TextCache.render(self.jenny_font, "⚡ JENNY: ¡FLASH!", True, color)
         else:
-            text = self.jenny_font.render("Jenny: en movimiento", True, (180, 220, 255))
+            text = TextCache.render(self.jenny_font, "Jenny: en movimiento", True, (180, 220, 255))
 
         rect = text.get_rect(topright=JENNY_INDICATOR_POS)
         bg = pygame.Surface((rect.width + 16, rect.height + 8), pygame.SRCALPHA)
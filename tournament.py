@@ -0,0 +1,169 @@
+"""Torneo bot-vs-boss en paralelo para ajustar constantes de los escenarios.
+
+Reparte N partidos con semilla entre todos los nucleos usando un pool de
+procesos. Cada worker importa su propia copia de los escenarios y crea su
+propio Box2D.b2World por partido; los resultados se reciben segun terminan
+y se agregan en un resumen (marcadores, linea temporal de goles e
+histograma de estados de la FSM del boss).
+
+Uso:
+    python tournament.py --scene first --matches 256 \\
+        --set first_scene.MUD_FRICTION_FACTOR=0.8 --out resultados.jsonl
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+GOAL_BUCKET_MS = 30000   # agrupacion de la linea temporal de goles
+
+
+def parse_override(text):
+    """'modulo.CONSTANTE=valor' -> ('modulo', 'CONSTANTE', valor)."""
+    target, _, raw = text.partition('=')
+    module, _, name = target.rpartition('.')
+    if not module or not name or not raw:
+        raise argparse.ArgumentTypeError(f"Override invalido: {text!r}")
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    return (module, name, value)
+
+
+def _apply_overrides(overrides):
+    for module_name, name, value in overrides:
+        module = importlib.import_module(module_name)
+        if not hasattr(module, name):
+            raise AttributeError(f"{module_name} no define {name}")
+        setattr(module, name, value)
+
+
+def play_match(scene_key, seed, policy_name='chase', overrides=()):
+    """Worker: juega un partido headless con semilla y devuelve su resultado."""
+    import headless_runner
+
+    _apply_overrides(overrides)
+    scene_cls = headless_runner._scene_classes()[scene_key]
+    return headless_runner.run_match(scene_cls, headless_runner.POLICIES[policy_name](),
+                                     seed=seed)
+
+
+class TournamentStats:
+    """Agregado incremental de resultados de partidos."""
+
+    def __init__(self):
+        self.matches = 0
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.goals_for = 0
+        self.goals_against = 0
+        self.goal_timeline = {}    # bucket (s) -> [goles jugador, goles boss]
+        self.boss_states = {}
+        self.sim_ms = 0
+        self.cpu_s = 0.0
+
+    def add(self, result):
+        self.matches += 1
+        left, right = result['score_left'], result['score_right']
+        if left > right:
+            self.wins += 1
+        elif left == right:
+            self.draws += 1
+        else:
+            self.losses += 1
+        self.goals_for += left
+        self.goals_against += right
+
+        for time_ms, side in result['goals']:
+            bucket = (time_ms // GOAL_BUCKET_MS) * GOAL_BUCKET_MS // 1000
+            counts = self.goal_timeline.setdefault(bucket, [0, 0])
+            counts[0 if side == 'left' else 1] += 1
+
+        for state, ticks in result['boss_states'].items():
+            self.boss_states[state] = self.boss_states.get(state, 0) + ticks
+
+        self.sim_ms += result['sim_ms']
+        self.cpu_s += result['wall_s']
+
+    def summary(self):
+        n = max(1, self.matches)
+        total_ticks = max(1, sum(self.boss_states.values()))
+        return {
+            'matches': self.matches,
+            'win_rate': self.wins / n,
+            'draw_rate': self.draws / n,
+            'loss_rate': self.losses / n,
+            'avg_goals_for': self.goals_for / n,
+            'avg_goals_against': self.goals_against / n,
+            'goal_timeline': dict(sorted(self.goal_timeline.items())),
+            'boss_states': {s: t / total_ticks for s, t in sorted(self.boss_states.items())},
+            'simulated_s': self.sim_ms / 1000.0,
+            'cpu_s': self.cpu_s,
+        }
+
+
+def run_tournament(scene_key, matches, base_seed=0, policy_name='chase',
+                   overrides=(), workers=None, on_result=None):
+    """Reparte `matches` partidos (semillas base_seed..base_seed+matches-1)
+    entre `workers` procesos. Llama a on_result(result) segun van llegando."""
+    stats = TournamentStats()
+    workers = workers or os.cpu_count() or 1
+    overrides = tuple(overrides)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(play_match, scene_key, base_seed + i, policy_name, overrides)
+            for i in range(matches)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            stats.add(result)
+            if on_result:
+                on_result(result)
+    return stats
+
+
+def main(argv=None):
+    import headless_runner
+
+    parser = argparse.ArgumentParser(description="Torneo paralelo de partidos headless")
+    parser.add_argument('--scene', choices=['first', 'second', 'third'], default='first')
+    parser.add_argument('--matches', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--policy', choices=sorted(headless_runner.POLICIES), default='chase')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--set', dest='overrides', action='append', default=[],
+                        type=parse_override, metavar='MODULO.CONSTANTE=VALOR')
+    parser.add_argument('--out', default=None, help="fichero JSONL con cada resultado")
+    args = parser.parse_args(argv)
+
+    out = open(args.out, 'w') if args.out else None
+    done = [0]
+
+    def on_result(result):
+        done[0] += 1
+        print(f"[{done[0]}/{args.matches}] seed={result['seed']} "
+              f"{result['score_left']} - {result['score_right']}", flush=True)
+        if out:
+            out.write(json.dumps(result) + "\n")
+
+    start = time.perf_counter()
+    try:
+        stats = run_tournament(args.scene, args.matches, args.seed, args.policy,
+                               args.overrides, args.workers, on_result)
+    finally:
+        if out:
+            out.close()
+
+    summary = stats.summary()
+    summary['wall_s'] = time.perf_counter() - start
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())